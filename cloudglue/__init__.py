@@ -1,23 +1,34 @@
 # cloudglue/__init__.py
 
-from cloudglue._version import __version__
+import os
 
-# Import and re-export the client
-from cloudglue.client.main import Cloudglue
-from cloudglue.client.resources import CloudglueError
+from cloudglue._lazy import _lazy_module
 
-# Re-export key models from the SDK
-from cloudglue.sdk.models.chat_completion_request import ChatCompletionRequest
-from cloudglue.sdk.models.chat_completion_response import ChatCompletionResponse
-from cloudglue.sdk.models.chat_completion_request_filter import ChatCompletionRequestFilter
-from cloudglue.sdk.models.chat_completion_request_filter_metadata_inner import ChatCompletionRequestFilterMetadataInner
-from cloudglue.sdk.models.chat_completion_request_filter_video_info_inner import ChatCompletionRequestFilterVideoInfoInner
-from cloudglue.sdk.models.chat_completion_request_filter_file_inner import ChatCompletionRequestFilterFileInner
-from cloudglue.sdk.models.file_update import FileUpdate
+# Public names are resolved on first attribute access (PEP 562) so that a bare
+# `import cloudglue` does not pay for loading the client and the generated SDK.
+_LAZY = {
+    # Package version, read from the installed distribution metadata
+    "__version__": ("cloudglue._version", "__version__"),
+    # Client
+    "Cloudglue": ("cloudglue.client.main", "Cloudglue"),
+    "AsyncCloudglue": ("cloudglue.client.async_main", "AsyncCloudglue"),
+    "CloudglueError": ("cloudglue.client.resources.base", "CloudglueError"),
+    "PollSettings": ("cloudglue.client.resources.polling", "PollSettings"),
+    "SSEEvent": ("cloudglue.client.resources.responses", "SSEEvent"),
+    # Key models from the SDK
+    "ChatCompletionRequest": ("cloudglue.sdk.models.chat_completion_request", "ChatCompletionRequest"),
+    "ChatCompletionResponse": ("cloudglue.sdk.models.chat_completion_response", "ChatCompletionResponse"),
+    "ChatCompletionRequestFilter": ("cloudglue.sdk.models.chat_completion_request_filter", "ChatCompletionRequestFilter"),
+    "ChatCompletionRequestFilterMetadataInner": ("cloudglue.sdk.models.chat_completion_request_filter_metadata_inner", "ChatCompletionRequestFilterMetadataInner"),
+    "ChatCompletionRequestFilterVideoInfoInner": ("cloudglue.sdk.models.chat_completion_request_filter_video_info_inner", "ChatCompletionRequestFilterVideoInfoInner"),
+    "ChatCompletionRequestFilterFileInner": ("cloudglue.sdk.models.chat_completion_request_filter_file_inner", "ChatCompletionRequestFilterFileInner"),
+    "FileUpdate": ("cloudglue.sdk.models.file_update", "FileUpdate"),
+}
 
 # Export key classes at the module level for clean imports
 __all__ = [
     "Cloudglue",
+    "AsyncCloudglue",
     "ChatCompletionRequest",
     "ChatCompletionResponse",
     "ChatCompletionRequestFilter",
@@ -26,4 +37,16 @@ __all__ = [
     "ChatCompletionRequestFilterFileInner",
     "FileUpdate",
     "CloudglueError",
+    "PollSettings",
+    "SSEEvent",
 ]
+
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY)
+
+
+# Resolve everything up front when requested, e.g. in CI to surface import errors early
+if os.environ.get("CLOUDGLUE_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,41 @@
+# cloudglue/_lazy.py
+"""Lazy attribute loading shared by the package re-export modules (PEP 562)."""
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def _lazy_module(
+    module_globals: Dict[str, Any], lazy: Dict[str, Tuple[str, str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module-level ``__getattr__`` and ``__dir__`` of a re-export module.
+
+    Each name in ``lazy`` maps to the module and attribute it is imported from on first
+    access. The result is then stored in ``module_globals``, so later lookups never get
+    here again.
+
+    ``__all__`` must be defined before this is called. Every name it lists has to be
+    resolvable through ``lazy``, which keeps the two in sync; the check is a set
+    difference, so it adds nothing noticeable to import time.
+
+    Raises:
+        ImportError: If ``__all__`` lists a name that is missing from ``lazy``.
+    """
+    module_name = module_globals["__name__"]
+    unresolved = set(module_globals.get("__all__", ())) - lazy.keys()
+    if unresolved:
+        raise ImportError(
+            f"{module_name}.__all__ lists names missing from _LAZY: {', '.join(sorted(unresolved))}"
+        )
+
+    def __getattr__(name):
+        spec = lazy.get(name)
+        if spec is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        obj = getattr(importlib.import_module(spec[0]), spec[1])
+        module_globals[name] = obj
+        return obj
+
+    def __dir__():
+        return sorted(list(module_globals) + list(lazy))
+
+    return __getattr__, __dir__
@@ -1,14 +1,17 @@
 # cloudglue/_version.py
 """Version management for the cloudglue package."""
 
-import importlib.metadata
+import functools
 
 
+@functools.lru_cache(maxsize=1)
 def get_version():
     """Get version from package metadata."""
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
-        return importlib.metadata.version("cloudglue")
-    except importlib.metadata.PackageNotFoundError:
+        return version("cloudglue")
+    except PackageNotFoundError:
         # Fallback version if package metadata is not available
         return "0.1.3"
 
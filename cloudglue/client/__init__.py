@@ -1,6 +1,16 @@
 # cloudglue/client/__init__.py
 
-from cloudglue.client.main import Cloudglue
-from cloudglue.client.resources import CloudglueError
+from cloudglue._lazy import _lazy_module
 
-__all__ = ["Cloudglue", "CloudglueError"]
+# Resolved on first access, see cloudglue/__init__.py
+_LAZY = {
+    "Cloudglue": ("cloudglue.client.main", "Cloudglue"),
+    "AsyncCloudglue": ("cloudglue.client.async_main", "AsyncCloudglue"),
+    "CloudglueError": ("cloudglue.client.resources.base", "CloudglueError"),
+    "PollSettings": ("cloudglue.client.resources.polling", "PollSettings"),
+}
+
+__all__ = ["Cloudglue", "AsyncCloudglue", "CloudglueError", "PollSettings"]
+
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY)
@@ -0,0 +1,215 @@
+# cloudglue/client/async_main.py
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Optional
+
+from cloudglue.client.main import Cloudglue
+
+
+class AsyncResource:
+    """Asyncio view of a Cloudglue resource.
+
+    Every public method of the wrapped resource is exposed as a coroutine with the
+    same name and signature, and iterator methods such as ``iter_all`` as async
+    generators. Static helpers such as ``create_filter`` stay synchronous since they
+    only build request objects locally. Methods returning a request function, such as
+    ``responses.specialize``, resolve to a coroutine function instead.
+    """
+
+    def __init__(self, resource):
+        """Initialize with the synchronous resource to wrap."""
+        self._resource = resource
+
+    def __getattr__(self, name):
+        attr = getattr(self._resource, name)
+        if name.startswith("_"):
+            return attr
+
+        if isinstance(inspect.getattr_static(type(self._resource), name, None), staticmethod):
+            wrapped = attr
+        elif name in _FACTORY_METHODS:
+            wrapped = _to_async_factory(attr)
+        elif hasattr(attr, "api") and not callable(attr):
+            # Nested namespace, e.g. chat.completions
+            wrapped = AsyncResource(attr)
+        elif inspect.isgeneratorfunction(attr):
+            wrapped = _to_async_iterator(attr)
+        elif callable(attr):
+            wrapped = _to_coroutine(attr)
+        else:
+            return attr
+
+        self.__dict__[name] = wrapped
+        return wrapped
+
+
+def _to_coroutine(fn):
+    """Wrap a blocking resource method so it runs in a worker thread.
+
+    Methods that wait for a job accept a ``cancel_event``. Unless the caller passes
+    one, cancelling the awaiting task sets an event of its own, so the worker thread
+    stops polling instead of waiting for the job in the background.
+
+    Methods that return a generator, e.g. ``responses.create(stream=True)``, resolve to
+    an async iterator over it instead.
+    """
+    accepts_cancel_event = "cancel_event" in inspect.signature(fn).parameters
+
+    async def call(*args, **kwargs):
+        if not accepts_cancel_event or kwargs.get("cancel_event") is not None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        cancel_event = threading.Event()
+        kwargs["cancel_event"] = cancel_event
+        try:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    @functools.wraps(fn)
+    async def method(*args, **kwargs):
+        result = await call(*args, **kwargs)
+        if inspect.isgenerator(result):
+            return _aiterate(result)
+        return result
+
+    return method
+
+
+# Methods that return a blocking request function rather than an API result
+_FACTORY_METHODS = frozenset({"specialize"})
+
+
+def _to_async_factory(fn):
+    """Wrap a method returning a blocking request function, e.g. ``responses.specialize``.
+
+    The function is built right away, since that involves no request, and is returned
+    wrapped as a coroutine function like any other resource method.
+    """
+
+    @functools.wraps(fn)
+    async def method(*args, **kwargs):
+        return _to_coroutine(fn(*args, **kwargs))
+
+    return method
+
+
+# Marks the end of an iterator advanced from a worker thread
+_EXHAUSTED = object()
+
+
+async def _aiterate(iterator):
+    """Iterate a blocking iterator from worker threads.
+
+    The next item is requested before the current one is handed to the caller, so
+    fetching the next page or event overlaps with the caller's work on the current item.
+    """
+    pending = asyncio.ensure_future(asyncio.to_thread(next, iterator, _EXHAUSTED))
+    try:
+        while True:
+            item = await pending
+            if item is _EXHAUSTED:
+                return
+            pending = asyncio.ensure_future(asyncio.to_thread(next, iterator, _EXHAUSTED))
+            yield item
+    finally:
+        # The generator cannot be closed while a worker thread is advancing it
+        if not pending.done():
+            await asyncio.wait([pending])
+        iterator.close()
+
+
+def _to_async_iterator(fn):
+    """Wrap a blocking generator method as an async generator."""
+
+    @functools.wraps(fn)
+    def method(*args, **kwargs):
+        return _aiterate(fn(*args, **kwargs))
+
+    return method
+
+
+class AsyncCloudglue:
+    """Asyncio client for interacting with the Cloudglue API.
+
+    Exposes the same resources as :class:`Cloudglue`, with API methods as coroutines,
+    so many requests can be issued concurrently from one event loop::
+
+        async with AsyncCloudglue() as client:
+            jobs = await asyncio.gather(
+                *[client.extract.create(url=url, prompt=prompt) for url in urls]
+            )
+
+    Streaming responses resolve to async iterators of the same SSEEvent tuples::
+
+        events = await client.responses.create(input=question, collections=ids, stream=True)
+        async for event in events:
+            ...
+
+    The generated SDK is synchronous, so each call runs in a worker thread of the
+    event loop's default executor on a connection from the shared pool. Polling
+    helpers such as ``run()`` or ``wait_until_finish=True`` block only their worker
+    thread, never the event loop.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        host: str = "https://api.cloudglue.dev/v1",
+        pool_maxsize: Optional[int] = None,
+        retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 512,
+        response_cache_ttl: Optional[float] = None,
+        compress_requests: bool = False,
+    ):
+        """Initialize the async Cloudglue client.
+
+        Args:
+            api_key: Your API key. If not provided, will try to use CLOUDGLUE_API_KEY env variable.
+            host: API host to connect to.
+            pool_maxsize: Maximum number of keep-alive connections kept open to the API host.
+            retries: Number of times a failed idempotent request is retried with backoff.
+            cache_ttl: Seconds that responses.get() and share.get() results are reused.
+                Caching is off when None.
+            cache_size: Maximum number of results cached per resource.
+            response_cache_ttl: Seconds that a deterministic responses.create() result is
+                reused for an identical request. Caching is off when None.
+            compress_requests: Gzip-compress large responses.create() request bodies.
+        """
+        self._client = Cloudglue(
+            api_key=api_key,
+            host=host,
+            pool_maxsize=pool_maxsize,
+            retries=retries,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            response_cache_ttl=response_cache_ttl,
+            compress_requests=compress_requests,
+        )
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not hasattr(attr, "api"):
+            return attr
+
+        resource = AsyncResource(attr)
+        self.__dict__[name] = resource
+        return resource
+
+    async def close(self):
+        """Close the API client and release its pooled connections.
+
+        Closing waits for in-flight requests, so it runs in a worker thread to keep the
+        event loop responsive.
+        """
+        await asyncio.to_thread(self._client.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,126 +1,425 @@
 # cloudglue/client/main.py
-from typing import Optional
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 import os
+import socket
 
-# Import from the generated SDK
-from cloudglue.sdk.api.chat_api import ChatApi
-from cloudglue.sdk.api.collections_api import CollectionsApi
-from cloudglue.sdk.api.transcribe_api import TranscribeApi
-from cloudglue.sdk.api.describe_api import DescribeApi
-from cloudglue.sdk.api.extract_api import ExtractApi
-from cloudglue.sdk.api.files_api import FilesApi
-from cloudglue.sdk.api.segmentations_api import SegmentationsApi
-from cloudglue.sdk.api.segments_api import SegmentsApi
-from cloudglue.sdk.api.search_api import SearchApi
-from cloudglue.sdk.api.thumbnails_api import ThumbnailsApi
-from cloudglue.sdk.api.frames_api import FramesApi
-from cloudglue.sdk.api.face_detection_api import FaceDetectionApi
-from cloudglue.sdk.api.face_match_api import FaceMatchApi
-from cloudglue.sdk.api.tags_api import TagsApi
-from cloudglue.sdk.api.file_segments_api import FileSegmentsApi
-from cloudglue.sdk.api.response_api import ResponseApi
-from cloudglue.sdk.api.share_api import ShareApi
-from cloudglue.sdk.api.data_connectors_api import DataConnectorsApi
-from cloudglue.sdk.configuration import Configuration
-from cloudglue.sdk.api_client import ApiClient
-
-# Import resource classes from the resources package
-from cloudglue.client.resources import (
-    Chat,
-    Files,
-    Transcribe,
-    Describe,
-    Extract,
-    Collections,
-    Segmentations,
-    Segments,
-    Search,
-    Thumbnails,
-    Frames,
-    FaceDetection,
-    FaceMatch,
-    Tags,
-    FileSegments,
-    Responses,
-    Share,
-    DataConnectors,
-)
+if TYPE_CHECKING:
+    from cloudglue.sdk.configuration import Configuration
+    from cloudglue.sdk.api.chat_api import ChatApi
+    from cloudglue.sdk.api.collections_api import CollectionsApi
+    from cloudglue.sdk.api.transcribe_api import TranscribeApi
+    from cloudglue.sdk.api.describe_api import DescribeApi
+    from cloudglue.sdk.api.extract_api import ExtractApi
+    from cloudglue.sdk.api.files_api import FilesApi
+    from cloudglue.sdk.api.segmentations_api import SegmentationsApi
+    from cloudglue.sdk.api.segments_api import SegmentsApi
+    from cloudglue.sdk.api.search_api import SearchApi
+    from cloudglue.sdk.api.thumbnails_api import ThumbnailsApi
+    from cloudglue.sdk.api.frames_api import FramesApi
+    from cloudglue.sdk.api.face_detection_api import FaceDetectionApi
+    from cloudglue.sdk.api.face_match_api import FaceMatchApi
+    from cloudglue.sdk.api.tags_api import TagsApi
+    from cloudglue.sdk.api.file_segments_api import FileSegmentsApi
+    from cloudglue.sdk.api.response_api import ResponseApi
+    from cloudglue.sdk.api.share_api import ShareApi
+    from cloudglue.sdk.api.data_connectors_api import DataConnectorsApi
+    from cloudglue.sdk.api_client import ApiClient
+    from cloudglue.client.resources.cache import TTLCache
+    from concurrent.futures import ThreadPoolExecutor
+    from cloudglue.client.resources import (
+        Chat,
+        Files,
+        Transcribe,
+        Describe,
+        Extract,
+        Collections,
+        Segmentations,
+        Segments,
+        Search,
+        Thumbnails,
+        Frames,
+        FaceDetection,
+        FaceMatch,
+        Tags,
+        FileSegments,
+        Responses,
+        Share,
+        DataConnectors,
+    )
 from cloudglue._version import __version__
 
 # SDK client constants
 SDK_CLIENT_NAME = "cloudglue-python"
 
+# Environment variable holding the default API key. It is read when a client
+# is created without an explicit api_key (not at import time), so keys loaded
+# into the environment after importing cloudglue, e.g. via dotenv, still apply.
+API_KEY_ENV_VAR = "CLOUDGLUE_API_KEY"
+
+# Transient statuses retried for idempotent requests
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Pooled connections sit idle between status polls, so TCP keep-alive probes
+# stop NATs and load balancers from silently dropping them. TCP_NODELAY is
+# urllib3's default and has to be repeated once socket options are set.
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15))
+elif hasattr(socket, "TCP_KEEPALIVE"):
+    # macOS name for the idle time before the first probe
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, 60))
+
 
 class Cloudglue:
     """Main client for interacting with the Cloudglue API."""
 
     def __init__(
-        self, api_key: Optional[str] = None, host: str = "https://api.cloudglue.dev/v1"
+        self,
+        api_key: Optional[str] = None,
+        host: str = "https://api.cloudglue.dev/v1",
+        pool_maxsize: Optional[int] = None,
+        retries: int = 3,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 512,
+        response_cache_ttl: Optional[float] = None,
+        compress_requests: bool = False,
     ):
         """Initialize the Cloudglue client.
 
         Args:
             api_key: Your API key. If not provided, will try to use CLOUDGLUE_API_KEY env variable.
             host: API host to connect to.
+            pool_maxsize: Maximum number of keep-alive connections kept open to the API host.
+                Size this to the number of threads issuing requests concurrently. Defaults to
+                the SDK default (5 per CPU).
+            retries: Number of times a failed idempotent request (connection errors and
+                429/5xx responses) is retried with exponential backoff.
+            cache_ttl: Seconds that responses.get() and share.get() results are reused
+                without another request. Every call returns its own copy of the cached
+                result. Finished responses are kept for at most an hour. Caching is off
+                when None.
+            cache_size: Maximum number of results cached per resource.
+            response_cache_ttl: Seconds that a copy of a completed responses.create()
+                result is returned for an identical request, without calling the model.
+                Only requests with an explicit temperature of at most 0.2 that are not
+                streamed, backgrounded or using include are cached. Off when None.
+            compress_requests: Gzip-compress responses.create() request bodies of 2 KB
+                or more, such as long multi-turn inputs. Only enable this if the API
+                host accepts gzip-encoded requests.
         """
-        self.api_key = api_key or os.environ.get("CLOUDGLUE_API_KEY")
+        self.api_key = api_key or os.environ.get(API_KEY_ENV_VAR)
         if not self.api_key:
             raise ValueError(
-                "API key must be provided either as an argument or via CLOUDGLUE_API_KEY environment variable"
+                f"API key must be provided either as an argument or via {API_KEY_ENV_VAR} environment variable"
             )
 
-        # Set up configuration
-        self.configuration = Configuration(host=host, access_token=self.api_key)
-        self.api_client = ApiClient(self.configuration)
-        
+        # The SDK configuration is built together with the API client, on first use
+        self._host = host
+        self._pool_maxsize = pool_maxsize
+        self._retries = retries
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._response_cache_ttl = response_cache_ttl
+        self._compress_requests = compress_requests
+
+    @cached_property
+    def configuration(self) -> Configuration:
+        """SDK configuration for the API client, created on first use."""
+        import urllib3
+        from cloudglue.sdk.configuration import Configuration
+
+        configuration = Configuration(host=self._host, access_token=self.api_key)
+        if self._pool_maxsize is not None:
+            configuration.connection_pool_maxsize = self._pool_maxsize
+        configuration.socket_options = SOCKET_OPTIONS
+        configuration.retries = urllib3.Retry(
+            total=self._retries,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        return configuration
+
+    @cached_property
+    def api_client(self) -> ApiClient:
+        """Shared API client, created on first use."""
+        from cloudglue.sdk.api_client import ApiClient
+
+        api_client = ApiClient(self.configuration)
+
         # Set custom SDK headers
-        self.api_client.set_default_header('x-sdk-client', SDK_CLIENT_NAME)
-        self.api_client.set_default_header('x-sdk-version', __version__)
-
-        # Initialize the specific API clients
-        self.chat_api = ChatApi(self.api_client)
-        self.collections_api = CollectionsApi(self.api_client)
-        self.transcribe_api = TranscribeApi(self.api_client)
-        self.describe_api = DescribeApi(self.api_client)
-        self.extract_api = ExtractApi(self.api_client)
-        self.files_api = FilesApi(self.api_client)
-        self.segmentations_api = SegmentationsApi(self.api_client)
-        self.segments_api = SegmentsApi(self.api_client)
-        self.search_api = SearchApi(self.api_client)
-        self.thumbnails_api = ThumbnailsApi(self.api_client)
-        self.frames_api = FramesApi(self.api_client)
-        self.face_detection_api = FaceDetectionApi(self.api_client)
-        self.face_match_api = FaceMatchApi(self.api_client)
-        self.tags_api = TagsApi(self.api_client)
-        self.file_segments_api = FileSegmentsApi(self.api_client)
-        self.response_api = ResponseApi(self.api_client)
-        self.share_api = ShareApi(self.api_client)
-        self.data_connectors_api = DataConnectorsApi(self.api_client)
-
-        # Set up resources with their respective API clients
-        self.chat = Chat(self.chat_api)
-        self.files = Files(self.files_api)
-        self.transcribe = Transcribe(self.transcribe_api)
-        self.describe = Describe(self.describe_api)
-        self.extract = Extract(self.extract_api)
-        self.collections = Collections(self.collections_api)
-        self.segmentations = Segmentations(self.segmentations_api)
-        self.segments = Segments(self.segments_api)
-        self.search = Search(self.search_api)
-        self.thumbnails = Thumbnails(self.thumbnails_api)
-        self.frames = Frames(self.frames_api)
-        self.face_detection = FaceDetection(self.face_detection_api)
-        self.face_match = FaceMatch(self.face_match_api)
-        self.tags = Tags(self.tags_api)
-        self.file_segments = FileSegments(self.file_segments_api)
-        self.responses = Responses(self.response_api)
-        self.share = Share(self.share_api)
-        self.data_connectors = DataConnectors(self.data_connectors_api)
+        api_client.set_default_header('x-sdk-client', SDK_CLIENT_NAME)
+        api_client.set_default_header('x-sdk-version', __version__)
+        return api_client
+
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool shared by concurrent helpers such as create_many() and delete_many().
+
+        Created on first use with one worker per pooled connection, so concurrent
+        requests never queue for a connection.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(
+            max_workers=self.configuration.connection_pool_maxsize,
+            thread_name_prefix="cloudglue-io",
+        )
+
+    def _new_cache(self, ttl: Optional[float]) -> Optional[TTLCache]:
+        """Cache of results kept for ``ttl`` seconds, or None when caching is off."""
+        if ttl is None:
+            return None
+        from cloudglue.client.resources.cache import TTLCache
+
+        return TTLCache(maxsize=self._cache_size, ttl=ttl)
+
+    # The specific API clients and resources are created on first access so
+    # that only the parts of the API a caller actually uses are set up.
+
+    @cached_property
+    def chat_api(self) -> ChatApi:
+        from cloudglue.sdk.api.chat_api import ChatApi
+
+        return ChatApi(self.api_client)
+
+    @cached_property
+    def files_api(self) -> FilesApi:
+        from cloudglue.sdk.api.files_api import FilesApi
+
+        return FilesApi(self.api_client)
+
+    @cached_property
+    def transcribe_api(self) -> TranscribeApi:
+        from cloudglue.sdk.api.transcribe_api import TranscribeApi
+
+        return TranscribeApi(self.api_client)
+
+    @cached_property
+    def describe_api(self) -> DescribeApi:
+        from cloudglue.sdk.api.describe_api import DescribeApi
+
+        return DescribeApi(self.api_client)
+
+    @cached_property
+    def extract_api(self) -> ExtractApi:
+        from cloudglue.sdk.api.extract_api import ExtractApi
+
+        return ExtractApi(self.api_client)
+
+    @cached_property
+    def collections_api(self) -> CollectionsApi:
+        from cloudglue.sdk.api.collections_api import CollectionsApi
+
+        return CollectionsApi(self.api_client)
+
+    @cached_property
+    def segmentations_api(self) -> SegmentationsApi:
+        from cloudglue.sdk.api.segmentations_api import SegmentationsApi
+
+        return SegmentationsApi(self.api_client)
+
+    @cached_property
+    def segments_api(self) -> SegmentsApi:
+        from cloudglue.sdk.api.segments_api import SegmentsApi
+
+        return SegmentsApi(self.api_client)
+
+    @cached_property
+    def search_api(self) -> SearchApi:
+        from cloudglue.sdk.api.search_api import SearchApi
+
+        return SearchApi(self.api_client)
+
+    @cached_property
+    def thumbnails_api(self) -> ThumbnailsApi:
+        from cloudglue.sdk.api.thumbnails_api import ThumbnailsApi
+
+        return ThumbnailsApi(self.api_client)
+
+    @cached_property
+    def frames_api(self) -> FramesApi:
+        from cloudglue.sdk.api.frames_api import FramesApi
+
+        return FramesApi(self.api_client)
+
+    @cached_property
+    def face_detection_api(self) -> FaceDetectionApi:
+        from cloudglue.sdk.api.face_detection_api import FaceDetectionApi
+
+        return FaceDetectionApi(self.api_client)
+
+    @cached_property
+    def face_match_api(self) -> FaceMatchApi:
+        from cloudglue.sdk.api.face_match_api import FaceMatchApi
+
+        return FaceMatchApi(self.api_client)
+
+    @cached_property
+    def tags_api(self) -> TagsApi:
+        from cloudglue.sdk.api.tags_api import TagsApi
+
+        return TagsApi(self.api_client)
+
+    @cached_property
+    def file_segments_api(self) -> FileSegmentsApi:
+        from cloudglue.sdk.api.file_segments_api import FileSegmentsApi
+
+        return FileSegmentsApi(self.api_client)
+
+    @cached_property
+    def response_api(self) -> ResponseApi:
+        from cloudglue.sdk.api.response_api import ResponseApi
+
+        return ResponseApi(self.api_client)
+
+    @cached_property
+    def share_api(self) -> ShareApi:
+        from cloudglue.sdk.api.share_api import ShareApi
+
+        return ShareApi(self.api_client)
+
+    @cached_property
+    def data_connectors_api(self) -> DataConnectorsApi:
+        from cloudglue.sdk.api.data_connectors_api import DataConnectorsApi
+
+        return DataConnectorsApi(self.api_client)
+
+    @cached_property
+    def chat(self) -> Chat:
+        from cloudglue.client.resources.chat import Chat
+
+        return Chat(self.chat_api, executor=self.executor)
+
+    @cached_property
+    def files(self) -> Files:
+        from cloudglue.client.resources.files import Files
+
+        return Files(self.files_api)
+
+    @cached_property
+    def transcribe(self) -> Transcribe:
+        from cloudglue.client.resources.transcribe import Transcribe
+
+        return Transcribe(self.transcribe_api)
+
+    @cached_property
+    def describe(self) -> Describe:
+        from cloudglue.client.resources.describe import Describe
+
+        return Describe(self.describe_api, executor=self.executor)
+
+    @cached_property
+    def extract(self) -> Extract:
+        from cloudglue.client.resources.extract import Extract
+
+        return Extract(self.extract_api, executor=self.executor)
+
+    @cached_property
+    def collections(self) -> Collections:
+        from cloudglue.client.resources.collections import Collections
+
+        return Collections(self.collections_api, executor=self.executor)
+
+    @cached_property
+    def segmentations(self) -> Segmentations:
+        from cloudglue.client.resources.segmentations import Segmentations
+
+        return Segmentations(self.segmentations_api)
+
+    @cached_property
+    def segments(self) -> Segments:
+        from cloudglue.client.resources.segments import Segments
+
+        return Segments(self.segments_api)
+
+    @cached_property
+    def search(self) -> Search:
+        from cloudglue.client.resources.search import Search
+
+        return Search(self.search_api)
+
+    @cached_property
+    def thumbnails(self) -> Thumbnails:
+        from cloudglue.client.resources.thumbnails import Thumbnails
+
+        return Thumbnails(self.thumbnails_api)
+
+    @cached_property
+    def frames(self) -> Frames:
+        from cloudglue.client.resources.frames import Frames
+
+        return Frames(self.frames_api)
+
+    @cached_property
+    def face_detection(self) -> FaceDetection:
+        from cloudglue.client.resources.face_detection import FaceDetection
+
+        return FaceDetection(self.face_detection_api)
+
+    @cached_property
+    def face_match(self) -> FaceMatch:
+        from cloudglue.client.resources.face_match import FaceMatch
+
+        return FaceMatch(self.face_match_api)
+
+    @cached_property
+    def tags(self) -> Tags:
+        from cloudglue.client.resources.tags import Tags
+
+        return Tags(self.tags_api)
+
+    @cached_property
+    def file_segments(self) -> FileSegments:
+        from cloudglue.client.resources.file_segments import FileSegments
+
+        return FileSegments(self.file_segments_api)
+
+    @cached_property
+    def responses(self) -> Responses:
+        from cloudglue.client.resources.responses import Responses
+
+        return Responses(
+            self.response_api,
+            cache=self._new_cache(self._cache_ttl),
+            create_cache=self._new_cache(self._response_cache_ttl),
+            executor=self.executor,
+            compress_requests=self._compress_requests,
+        )
+
+    @cached_property
+    def share(self) -> Share:
+        from cloudglue.client.resources.share import Share
+
+        return Share(
+            self.share_api, cache=self._new_cache(self._cache_ttl), executor=self.executor
+        )
+
+    @cached_property
+    def data_connectors(self) -> DataConnectors:
+        from cloudglue.client.resources.data_connectors import DataConnectors
+
+        return DataConnectors(self.data_connectors_api)
 
     def close(self):
-        """Close the API client."""
-        if hasattr(self, "api_client") and self.api_client:
-            self.api_client.close()
+        """Close the API client, release its pooled connections and stop its thread pool.
+
+        Connections are kept alive between requests and reused across all
+        resources, so call this (or use the client as a context manager) once
+        you are done to close them instead of waiting for garbage collection.
+        """
+        # Avoid creating the API client or the thread pool just to close them
+        if "executor" in self.__dict__:
+            self.executor.shutdown(wait=True)
+        if "api_client" in self.__dict__:
+            self.api_client.rest_client.pool_manager.clear()
 
     def __enter__(self):
         return self
@@ -1,28 +1,38 @@
 # cloudglue/client/resources/__init__.py
 """Cloudglue client resource classes."""
 
-from cloudglue.client.resources.base import CloudglueError
-from cloudglue.client.resources.chat import Chat, Completions
-from cloudglue.client.resources.collections import Collections
-from cloudglue.client.resources.extract import Extract
-from cloudglue.client.resources.transcribe import Transcribe
-from cloudglue.client.resources.describe import Describe
-from cloudglue.client.resources.files import Files
-from cloudglue.client.resources.segmentations import Segmentations
-from cloudglue.client.resources.segments import Segments
-from cloudglue.client.resources.search import Search
-from cloudglue.client.resources.thumbnails import Thumbnails
-from cloudglue.client.resources.frames import Frames
-from cloudglue.client.resources.face_detection import FaceDetection
-from cloudglue.client.resources.face_match import FaceMatch
-from cloudglue.client.resources.tags import Tags
-from cloudglue.client.resources.file_segments import FileSegments
-from cloudglue.client.resources.responses import Responses
-from cloudglue.client.resources.share import Share
-from cloudglue.client.resources.data_connectors import DataConnectors
+from cloudglue._lazy import _lazy_module
+
+# Resolved on first access, see cloudglue/__init__.py
+_LAZY = {
+    "CloudglueError": ("cloudglue.client.resources.base", "CloudglueError"),
+    "PollSettings": ("cloudglue.client.resources.polling", "PollSettings"),
+    "SSEEvent": ("cloudglue.client.resources.responses", "SSEEvent"),
+    "Chat": ("cloudglue.client.resources.chat", "Chat"),
+    "Completions": ("cloudglue.client.resources.chat", "Completions"),
+    "Collections": ("cloudglue.client.resources.collections", "Collections"),
+    "Extract": ("cloudglue.client.resources.extract", "Extract"),
+    "Transcribe": ("cloudglue.client.resources.transcribe", "Transcribe"),
+    "Describe": ("cloudglue.client.resources.describe", "Describe"),
+    "Files": ("cloudglue.client.resources.files", "Files"),
+    "Segmentations": ("cloudglue.client.resources.segmentations", "Segmentations"),
+    "Segments": ("cloudglue.client.resources.segments", "Segments"),
+    "Search": ("cloudglue.client.resources.search", "Search"),
+    "Thumbnails": ("cloudglue.client.resources.thumbnails", "Thumbnails"),
+    "Frames": ("cloudglue.client.resources.frames", "Frames"),
+    "FaceDetection": ("cloudglue.client.resources.face_detection", "FaceDetection"),
+    "FaceMatch": ("cloudglue.client.resources.face_match", "FaceMatch"),
+    "Tags": ("cloudglue.client.resources.tags", "Tags"),
+    "FileSegments": ("cloudglue.client.resources.file_segments", "FileSegments"),
+    "Responses": ("cloudglue.client.resources.responses", "Responses"),
+    "Share": ("cloudglue.client.resources.share", "Share"),
+    "DataConnectors": ("cloudglue.client.resources.data_connectors", "DataConnectors"),
+}
 
 __all__ = [
     "CloudglueError",
+    "PollSettings",
+    "SSEEvent",
     "Chat",
     "Completions",
     "Collections",
@@ -44,3 +54,5 @@ __all__ = [
     "DataConnectors",
 ]
 
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY)
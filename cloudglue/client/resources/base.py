@@ -1,6 +1,24 @@
 # cloudglue/client/resources/base.py
 """Base classes and exceptions for Cloudglue resources."""
-from typing import Dict, Any
+import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from orjson import OPT_SORT_KEYS, dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON."""
+        return _orjson_dumps(obj, option=OPT_SORT_KEYS if sort_keys else None)
+
+except ImportError:  # orjson is optional, see the "fast" extra
+    import json
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON."""
+        return json.dumps(obj, sort_keys=sort_keys).encode("utf-8")
 
 
 class CloudglueError(Exception):
@@ -21,3 +39,103 @@ class CloudglueError(Exception):
         self.reason = reason
         super(CloudglueError, self).__init__(self.message)
 
+
+
+def _wrap_api_errors(fn):
+    """Decorator translating errors raised by a resource method into CloudglueError.
+
+    API errors keep their status code, body, headers and reason. Invalid arguments
+    rejected by the SDK models (``ValueError``, which includes pydantic's
+    ``ValidationError``) and network failures are wrapped with their message and
+    chained as the cause. A ``TimeoutError`` from waiting on a job propagates unchanged
+    so callers can tell it apart from a network failure. Any other exception, such as
+    a ``TypeError`` for a wrong keyword argument or a ``KeyError``, points at a bug and
+    propagates unchanged.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except (CloudglueError, TimeoutError):
+            raise
+        except (ValueError, OSError) as e:
+            raise CloudglueError(str(e)) from e
+        except Exception as e:
+            # Imported here so that importing CloudglueError does not load the generated SDK
+            from cloudglue.sdk.rest import ApiException
+            from urllib3.exceptions import HTTPError
+
+            if isinstance(e, ApiException):
+                raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason) from e
+            if isinstance(e, HTTPError):
+                raise CloudglueError(str(e)) from e
+            raise
+
+    return wrapper
+
+
+def _map_concurrently(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """Call ``fn`` on every item from up to ``max_concurrency`` threads.
+
+    Results keep the order of ``items``. The first exception raised by ``fn`` is
+    re-raised once all started calls have finished.
+
+    With a shared ``executor`` no threads are started or torn down per call; at most
+    ``max_concurrency`` of these items are submitted at a time. ``fn`` must not itself
+    wait on work submitted to the same executor.
+    """
+    items = list(items)
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+            return list(executor.map(fn, items))
+
+    slots = threading.BoundedSemaphore(max_concurrency)
+
+    def run(item):
+        try:
+            return fn(item)
+        finally:
+            slots.release()
+
+    futures = []
+    for item in items:
+        slots.acquire()
+        futures.append(executor.submit(run, item))
+    wait(futures)
+    return [future.result() for future in futures]
+
+
+def _map_concurrently_settled(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int,
+    description: str = "requests",
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """Like :func:`_map_concurrently`, but keeps going when some calls fail.
+
+    Raises:
+        CloudglueError: If any call raised a CloudglueError. Its ``data`` holds one entry
+            per item, in order: the result, or the CloudglueError raised for that item,
+            so callers can retry just the failures.
+    """
+
+    def settle(item):
+        try:
+            return fn(item)
+        except CloudglueError as e:
+            return e
+
+    results = _map_concurrently(settle, items, max_concurrency, executor)
+    failed = sum(isinstance(result, CloudglueError) for result in results)
+    if failed:
+        raise CloudglueError(f"{failed} of {len(results)} {description} failed", data=results)
+    return results
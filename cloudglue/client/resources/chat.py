@@ -1,5 +1,6 @@
 # cloudglue/client/resources/chat.py
 """Chat and Completions resources for Cloudglue API."""
+from concurrent.futures import Executor
 from typing import List, Dict, Any, Optional, Union, Literal
 
 from cloudglue.sdk.models.chat_completion_request import ChatCompletionRequest
@@ -7,17 +8,22 @@ from cloudglue.sdk.models.chat_completion_request_filter import ChatCompletionRe
 from cloudglue.sdk.models.chat_completion_request_filter_metadata_inner import ChatCompletionRequestFilterMetadataInner
 from cloudglue.sdk.models.chat_completion_request_filter_video_info_inner import ChatCompletionRequestFilterVideoInfoInner
 from cloudglue.sdk.models.chat_completion_request_filter_file_inner import ChatCompletionRequestFilterFileInner
-from cloudglue.sdk.rest import ApiException
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import _map_concurrently, _wrap_api_errors
 
 
 class Completions:
     """Handles chat completions operations."""
 
-    def __init__(self, api):
-        """Initialize with the API client."""
+    def __init__(self, api, executor: Optional[Executor] = None):
+        """Initialize with the API client.
+
+        Args:
+            api: The generated Chat API client.
+            executor: Optional thread pool shared by concurrent helpers such as create_many().
+        """
         self.api = api
+        self._executor = executor
 
     @staticmethod
     def _create_metadata_filter(
@@ -155,6 +161,23 @@ class Completions:
                     {'path': 'duration_seconds', 'operator': 'LessThan', 'value_text': '600'}
                 ]
             )
+
+            Filters that never change can be built once, e.g. at module level, and
+            passed to every create() call instead of being rebuilt per request:
+
+            from cloudglue.client.resources import Completions
+
+            SHORT_TUTORIALS = Completions.create_filter(
+                metadata_filters=[{'path': 'category', 'operator': 'Equal', 'value_text': 'tutorial'}],
+                video_info_filters=[{'path': 'duration_seconds', 'operator': 'LessThan', 'value_text': '600'}],
+            )
+
+            for question in questions:
+                client.chat.completions.create(
+                    messages=[{'role': 'user', 'content': question}],
+                    collections=collection_ids,
+                    filter=SHORT_TUTORIALS,
+                )
         """
         metadata_objs = None
         if metadata_filters:
@@ -180,6 +203,7 @@ class Completions:
             file=file_objs,
         )
 
+    @_wrap_api_errors
     def create(
         self,
         messages: List[Dict[str, str]],
@@ -187,10 +211,13 @@ class Completions:
         collections: Optional[List[str]] = None,
         filter: Optional[Union[ChatCompletionRequestFilter, Dict[str, Any]]] = None,
         temperature: Optional[float] = None,
-        **kwargs,
     ):
         """Create a chat completion.
 
+        The chat completions endpoint returns the full completion at once. To receive
+        tokens as they are generated, use ``client.responses.create(..., stream=True)``,
+        which streams server-sent events.
+
         Args:
             messages: List of message dictionaries with "role" and "content" keys.
             model: The model to use for completion.
@@ -198,7 +225,6 @@ class Completions:
             filter: Filter criteria to constrain search results. Can be a ChatCompletionRequestFilter object
                    or a dictionary with 'metadata', 'video_info', and/or 'file' keys.
             temperature: Sampling temperature. If None, uses API default.
-            **kwargs: Additional parameters for the request.
 
         Returns:
             The API response with generated completion.
@@ -206,32 +232,48 @@ class Completions:
         Raises:
             CloudglueError: If there is an error making the API request or processing the response.
         """
-        try:
-            # Handle filter parameter
-            if filter is not None:
-                if isinstance(filter, dict):
-                    # Convert dictionary to ChatCompletionRequestFilter
-                    filter = ChatCompletionRequestFilter.from_dict(filter)
-                elif isinstance(filter, ChatCompletionRequestFilter):
-                    # Already the correct type, no conversion needed
-                    pass
-                else:
-                    raise ValueError("filter must be a ChatCompletionRequestFilter object or dictionary")
-            
-            request = ChatCompletionRequest(
-                model=model,
-                messages=messages,
-                collections=collections or [],
-                filter=filter,
-                temperature=temperature,
-                **kwargs,
-            )
-            return self.api.create_completion(chat_completion_request=request)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Handle filter parameter
+        if filter is not None:
+            if isinstance(filter, dict):
+                # Convert dictionary to ChatCompletionRequestFilter
+                filter = ChatCompletionRequestFilter.from_dict(filter)
+            elif isinstance(filter, ChatCompletionRequestFilter):
+                # Already the correct type, no conversion needed
+                pass
+            else:
+                raise ValueError("filter must be a ChatCompletionRequestFilter object or dictionary")
+        
+        request = ChatCompletionRequest(
+            model=model,
+            messages=messages,
+            collections=collections or [],
+            filter=filter,
+            temperature=temperature,
+        )
+        return self.api.create_completion(chat_completion_request=request)
 
+    def create_many(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+    ):
+        """Create several chat completions concurrently.
+
+        Args:
+            requests: Keyword arguments for create(), one dict per completion.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The API responses, in the order of requests.
+
+        Raises:
+            CloudglueError: If there is an error creating any of the completions.
+        """
+        return _map_concurrently(
+            lambda kwargs: self.create(**kwargs), requests, max_concurrency, self._executor
+        )
+
+    @_wrap_api_errors
     def get(self, id: str):
         """Retrieve a chat completion by ID.
 
@@ -244,13 +286,9 @@ class Completions:
         Raises:
             CloudglueError: If there is an error making the API request or processing the response.
         """
-        try:
-            return self.api.get_chat_completion(id=id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.get_chat_completion(id=id)
 
+    @_wrap_api_errors
     def list(
         self,
         limit: Optional[int] = None,
@@ -272,24 +310,19 @@ class Completions:
         Raises:
             CloudglueError: If there is an error making the API request or processing the response.
         """
-        try:
-            return self.api.list_chat_completions(
-                limit=limit,
-                offset=offset,
-                created_before=created_before,
-                created_after=created_after,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.list_chat_completions(
+            limit=limit,
+            offset=offset,
+            created_before=created_before,
+            created_after=created_after,
+        )
 
 
 class Chat:
     """Chat namespace for the Cloudglue client."""
 
-    def __init__(self, api):
-        """Initialize with the API client."""
+    def __init__(self, api, executor: Optional[Executor] = None):
+        """Initialize with the API client and an optional thread pool for concurrent helpers."""
         self.api = api
-        self.completions = Completions(api)
+        self.completions = Completions(api, executor)
 
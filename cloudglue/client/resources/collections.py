@@ -1,8 +1,8 @@
 # cloudglue/client/resources/collections.py
 """Collections resource for Cloudglue API."""
-import json
-import time
-from typing import Dict, Any, Optional, Union
+import threading
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Union
 
 from cloudglue.sdk.models.new_collection import NewCollection
 from cloudglue.sdk.models.add_collection_file import AddCollectionFile
@@ -13,20 +13,36 @@ from cloudglue.sdk.models.collection_update import CollectionUpdate
 from cloudglue.sdk.models.new_collection_face_detection_config import NewCollectionFaceDetectionConfig
 from cloudglue.sdk.rest import ApiException
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import (
+    CloudglueError,
+    _json_dumps,
+    _map_concurrently_settled,
+    _wrap_api_errors,
+)
+from cloudglue.client.resources.pagination import MAX_PAGE_SIZE, _paginate
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _ConditionalGet,
+    _FILE_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class Collections:
     """Client for the Cloudglue Collections API."""
 
-    def __init__(self, api):
+    def __init__(self, api, executor: Optional[Executor] = None):
         """Initialize the Collections client.
 
         Args:
             api: The DefaultApi instance.
+            executor: Optional thread pool shared by concurrent helpers such as add_videos().
         """
         self.api = api
+        self._executor = executor
 
+    @_wrap_api_errors
     def create(
         self,
         collection_type: str,
@@ -58,50 +74,46 @@ class Collections:
         Raises:
             CloudglueError: If there is an error creating the collection or processing the request.
         """
-        try:
-            # Create request object using the SDK model
-            if description is None:  # TODO(kdr): temporary fix for API
-                description = ""
-
-            # Handle default_segmentation_config parameter - convert to DefaultSegmentationConfig
-            if default_segmentation_config is not None:
-                if isinstance(default_segmentation_config, dict):
-                    default_segmentation_config = DefaultSegmentationConfig.from_dict(default_segmentation_config)
-                elif isinstance(default_segmentation_config, SegmentationConfig):
-                    # Convert SegmentationConfig to DefaultSegmentationConfig
-                    # Note: manual_config is not supported for default segmentation configs
-                    default_segmentation_config = DefaultSegmentationConfig(
-                        strategy=default_segmentation_config.strategy,
-                        uniform_config=default_segmentation_config.uniform_config,
-                        shot_detector_config=default_segmentation_config.shot_detector_config,
-                        narrative_config=default_segmentation_config.narrative_config,
-                        keyframe_config=default_segmentation_config.keyframe_config,
-                        start_time_seconds=default_segmentation_config.start_time_seconds,
-                        end_time_seconds=default_segmentation_config.end_time_seconds,
-                    )
-
-            # Handle face_detection_config parameter
-            if isinstance(face_detection_config, dict):
-                face_detection_config = NewCollectionFaceDetectionConfig.from_dict(face_detection_config)
-
-            request = NewCollection(
-                collection_type=collection_type,
-                name=name,
-                description=description,
-                extract_config=extract_config,
-                transcribe_config=transcribe_config,
-                describe_config=describe_config,
-                default_segmentation_config=default_segmentation_config,
-                face_detection_config=face_detection_config,
-            )
-            # Use the standard method to get a properly typed object
-            response = self.api.create_collection(new_collection=request)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        # Create request object using the SDK model
+        if description is None:  # TODO(kdr): temporary fix for API
+            description = ""
+
+        # Handle default_segmentation_config parameter - convert to DefaultSegmentationConfig
+        if default_segmentation_config is not None:
+            if isinstance(default_segmentation_config, dict):
+                default_segmentation_config = DefaultSegmentationConfig.from_dict(default_segmentation_config)
+            elif isinstance(default_segmentation_config, SegmentationConfig):
+                # Convert SegmentationConfig to DefaultSegmentationConfig
+                # Note: manual_config is not supported for default segmentation configs
+                default_segmentation_config = DefaultSegmentationConfig(
+                    strategy=default_segmentation_config.strategy,
+                    uniform_config=default_segmentation_config.uniform_config,
+                    shot_detector_config=default_segmentation_config.shot_detector_config,
+                    narrative_config=default_segmentation_config.narrative_config,
+                    keyframe_config=default_segmentation_config.keyframe_config,
+                    start_time_seconds=default_segmentation_config.start_time_seconds,
+                    end_time_seconds=default_segmentation_config.end_time_seconds,
+                )
+
+        # Handle face_detection_config parameter
+        if isinstance(face_detection_config, dict):
+            face_detection_config = NewCollectionFaceDetectionConfig.from_dict(face_detection_config)
+
+        request = NewCollection(
+            collection_type=collection_type,
+            name=name,
+            description=description,
+            extract_config=extract_config,
+            transcribe_config=transcribe_config,
+            describe_config=describe_config,
+            default_segmentation_config=default_segmentation_config,
+            face_detection_config=face_detection_config,
+        )
+        # Use the standard method to get a properly typed object
+        response = self.api.create_collection(new_collection=request)
+        return response
+
+    @_wrap_api_errors
     def list(
         self,
         limit: Optional[int] = None,
@@ -125,17 +137,52 @@ class Collections:
         Raises:
             CloudglueError: If there is an error listing collections or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.list_collections(
-                limit=limit, offset=offset, order=order, sort=sort, collection_type=collection_type
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.list_collections(
+            limit=limit, offset=offset, order=order, sort=sort, collection_type=collection_type
+        )
+        return response
+
+    def iter_all(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order: Optional[str] = None,
+        sort: Optional[str] = None,
+        collection_type: Optional[str] = None,
+    ):
+        """Iterate over all collections, fetching pages as needed.
+
+        Args:
+            page_size: Number of collections requested per page (max 100)
+            order: Field to sort by ('created_at'). Defaults to 'created_at'
+            sort: Sort direction ('asc', 'desc'). Defaults to 'desc'
+            collection_type: Filter by collection type ('video', 'audio', 'image', 'text')
+
+        Yields:
+            Collection objects
 
+        Raises:
+            CloudglueError: If there is an error listing collections or processing the request.
+        """
+        yield from _paginate(
+            self.list, page_size, order=order, sort=sort, collection_type=collection_type
+        )
+
+    def count(self, collection_type: Optional[str] = None) -> int:
+        """Count collections.
+
+        Args:
+            collection_type: Filter by collection type ('video', 'audio', 'image', 'text')
+
+        Returns:
+            The total number of matching collections
+
+        Raises:
+            CloudglueError: If there is an error listing collections or processing the request.
+        """
+        return self.list(limit=1, collection_type=collection_type).total
+
+    @_wrap_api_errors
     def get(self, collection_id: str):
         """Get a specific collection by ID.
 
@@ -148,15 +195,11 @@ class Collections:
         Raises:
             CloudglueError: If there is an error retrieving the collection or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_collection(collection_id=collection_id)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.get_collection(collection_id=collection_id)
+        return response
 
+    @_wrap_api_errors
     def delete(self, collection_id: str):
         """Delete a collection.
 
@@ -169,15 +212,11 @@ class Collections:
         Raises:
             CloudglueError: If there is an error deleting the collection or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.delete_collection(collection_id=collection_id)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.delete_collection(collection_id=collection_id)
+        return response
 
+    @_wrap_api_errors
     def update(
         self,
         collection_id: str,
@@ -197,28 +236,24 @@ class Collections:
         Raises:
             CloudglueError: If there is an error updating the collection or processing the request.
         """
-        try:
-            # Create update request object
-            update_data = {}
-            if name is not None:
-                update_data["name"] = name
-            if description is not None:
-                update_data["description"] = description
-            
-            if not update_data:
-                raise CloudglueError("At least one field (name or description) must be provided for update")
-            
-            collection_update = CollectionUpdate(**update_data)
-            response = self.api.update_collection(
-                collection_id=collection_id,
-                collection_update=collection_update
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        # Create update request object
+        update_data = {}
+        if name is not None:
+            update_data["name"] = name
+        if description is not None:
+            update_data["description"] = description
+        
+        if not update_data:
+            raise CloudglueError("At least one field (name or description) must be provided for update")
+        
+        collection_update = CollectionUpdate(**update_data)
+        response = self.api.update_collection(
+            collection_id=collection_id,
+            collection_update=collection_update
+        )
+        return response
+
+    @_wrap_api_errors
     def add_video(
         self,
         collection_id: str,
@@ -229,6 +264,8 @@ class Collections:
         wait_until_finish: bool = False,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Add a video file to a collection.
 
@@ -239,8 +276,10 @@ class Collections:
             segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
             segmentation_config: Configuration for video segmentation. Cannot be provided together with segmentation_id.
             wait_until_finish: Whether to wait for the video processing to complete
-            poll_interval: How often to check the video status (in seconds) if waiting
+            poll_interval: Maximum interval between video status checks (in seconds) if waiting
             timeout: Maximum time to wait for processing (in seconds) if waiting
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
 
         Returns:
             The typed CollectionFile object with association details. If wait_until_finish
@@ -248,61 +287,157 @@ class Collections:
 
         Raises:
             CloudglueError: If there is an error adding the video or processing the request.
+            TimeoutError: If wait_until_finish is True and processing does not complete within the timeout.
         """
-        try:
-            # Validate that either file_id or url is provided
-            if not file_id and not url:
-                raise CloudglueError("Either file_id or url must be provided")
-            
-            if segmentation_id and segmentation_config:
-                raise ValueError("Cannot provide both segmentation_id and segmentation_config")
-
-            # Handle segmentation_config parameter
-            if isinstance(segmentation_config, dict):
-                segmentation_config = SegmentationConfig.from_dict(segmentation_config)
-
-            # Create request object using the SDK model
-            # The post-processing script fixes the generated model to properly handle
-            # the oneOf constraint (either file_id or url, not both required)
-            request = AddCollectionFile(
-                file_id=file_id,
-                url=url,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-            )
-
-            # Use the standard method to get a properly typed object
-            response = self.api.add_video(
-                collection_id=collection_id, add_collection_file=request
-            )
+        # Validate that either file_id or url is provided
+        if not file_id and not url:
+            raise CloudglueError("Either file_id or url must be provided")
+        
+        if segmentation_id and segmentation_config:
+            raise ValueError("Cannot provide both segmentation_id and segmentation_config")
+
+        # Handle segmentation_config parameter
+        if isinstance(segmentation_config, dict):
+            segmentation_config = SegmentationConfig.from_dict(segmentation_config)
+
+        # Create request object using the SDK model
+        # The post-processing script fixes the generated model to properly handle
+        # the oneOf constraint (either file_id or url, not both required)
+        request = AddCollectionFile(
+            file_id=file_id,
+            url=url,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+        )
+
+        # Use the standard method to get a properly typed object
+        response = self.api.add_video(
+            collection_id=collection_id, add_collection_file=request
+        )
+
+        # If not waiting for completion, return immediately
+        if not wait_until_finish:
+            return response
 
-            # If not waiting for completion, return immediately
-            if not wait_until_finish:
-                return response
+        # Otherwise poll until completion or timeout
+        response_file_id = response.file_id
+        get_video = _ConditionalGet(
+            self.api.api_client,
+            self.api.get_video_without_preload_content,
+            "CollectionFile",
+            _FILE_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_video(collection_id=collection_id, file_id=response_file_id),
+            lambda status: status.status in _FILE_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Video processing",
+            initial=response,
+            cancel_event=cancel_event,
+        )
+
+
+    def add_videos(
+        self,
+        collection_id: str,
+        file_ids: Optional[List[str]] = None,
+        urls: Optional[List[str]] = None,
+        segmentation_id: Optional[str] = None,
+        segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
+        wait_until_finish: bool = False,
+        poll_interval: int = 5,
+        timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
+        max_concurrency: int = 10,
+    ) -> Dict[str, Any]:
+        """Add several videos to a collection.
 
-            # Otherwise poll until completion or timeout
-            response_file_id = response.file_id
-            elapsed = 0
-            terminal_states = ["ready", "completed", "failed", "not_applicable"]
+        All videos are submitted first, concurrently, and every submission is attempted
+        even if some of them fail. When waiting, their status is then checked with a
+        single list request per interval instead of one request per video.
 
-            while elapsed < timeout:
-                status = self.get_video(collection_id=collection_id, file_id=response_file_id)
+        Args:
+            collection_id: The ID of the collection
+            file_ids: IDs of the files to add to the collection
+            urls: URLs of the files to add to the collection, e.g. YouTube URLs
+            segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
+            segmentation_config: Configuration for video segmentation. Cannot be provided together with segmentation_id.
+            wait_until_finish: Whether to wait for the video processing to complete
+            poll_interval: Maximum interval between video status checks (in seconds) if waiting
+            timeout: Maximum time to wait for processing (in seconds) if waiting
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
+            max_concurrency: Maximum number of submissions in flight at once.
 
-                if status.status in terminal_states:
-                    return status
+        Returns:
+            A dict mapping each file ID to its typed CollectionFile object. If
+            wait_until_finish is True, holds the final state of every video once all of
+            them are done processing.
 
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+        Raises:
+            CloudglueError: If any submission failed, before waiting. Its data lists, in
+                the order of file_ids followed by urls, the CollectionFile or the
+                CloudglueError for each video. Also raised if there is an error checking
+                the status of the videos.
+            TimeoutError: If wait_until_finish is True and some videos are still processing
+                when the timeout is reached. The message lists their file IDs.
+        """
+        if not file_ids and not urls:
+            raise CloudglueError("Either file_ids or urls must be provided")
 
-            raise TimeoutError(
-                f"Video processing did not complete within {timeout} seconds"
+        sources = [{"file_id": file_id} for file_id in file_ids or []]
+        sources += [{"url": url} for url in urls or []]
+        submitted = _map_concurrently_settled(
+            lambda source: self.add_video(
+                collection_id=collection_id,
+                segmentation_id=segmentation_id,
+                segmentation_config=segmentation_config,
+                **source,
+            ),
+            sources,
+            max_concurrency,
+            description="video submissions",
+            executor=self._executor,
+        )
+        results = {response.file_id: response for response in submitted}
+
+        if not wait_until_finish:
+            return results
+
+        pending = {
+            file_id for file_id, video in results.items()
+            if video.status not in _FILE_TERMINAL_STATES
+        }
+
+        def refresh():
+            id_filter = {
+                "file": [{"path": "id", "operator": "In", "value_text_array": sorted(pending)}]
+            }
+            for video in self.iter_all_videos(collection_id=collection_id, filter=id_filter):
+                if video.file_id in pending:
+                    results[video.file_id] = video
+                    if video.status in _FILE_TERMINAL_STATES:
+                        pending.discard(video.file_id)
+            return results
+
+        settings = _resolve_poll_settings(poll_settings, poll_interval, timeout)
+        try:
+            return _poll(
+                refresh,
+                lambda _: not pending,
+                settings,
+                description="Video processing",
+                initial=results,
+                cancel_event=cancel_event,
             )
+        except TimeoutError as e:
+            raise TimeoutError(
+                f"{len(pending)} of {len(results)} videos did not finish processing within "
+                f"{settings.timeout} seconds: {', '.join(sorted(pending))}"
+            ) from e
 
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+    @_wrap_api_errors
     def get_video(self, collection_id: str, file_id: str):
         """Get information about a specific video in a collection.
 
@@ -316,15 +451,11 @@ class Collections:
         Raises:
             CloudglueError: If there is an error retrieving the video or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_video(collection_id=collection_id, file_id=file_id)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.get_video(collection_id=collection_id, file_id=file_id)
+        return response
 
+    @_wrap_api_errors
     def list_videos(
         self,
         collection_id: str,
@@ -356,34 +487,94 @@ class Collections:
         Raises:
             CloudglueError: If there is an error listing the videos or processing the request.
         """
-        try:
-            # Convert filter dict to SearchFilter object if needed
-            filter_obj = None
-            if filter is not None:
-                if isinstance(filter, dict):
-                    # Convert dict to SearchFilter object
-                    filter_obj = SearchFilter(**filter)
-                else:
-                    filter_obj = filter
-
-            # Use the standard method to get a properly typed object
-            response = self.api.list_videos(
-                collection_id=collection_id,
-                limit=limit,
-                offset=offset,
-                status=status,
-                added_before=added_before,
-                added_after=added_after,
-                order=order,
-                sort=sort,
-                filter=json.dumps(filter_obj.to_dict()) if filter_obj else None,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Convert filter dict to SearchFilter object if needed
+        filter_obj = None
+        if filter is not None:
+            if isinstance(filter, dict):
+                # Convert dict to SearchFilter object
+                filter_obj = SearchFilter(**filter)
+            else:
+                filter_obj = filter
+
+        # Use the standard method to get a properly typed object
+        response = self.api.list_videos(
+            collection_id=collection_id,
+            limit=limit,
+            offset=offset,
+            status=status,
+            added_before=added_before,
+            added_after=added_after,
+            order=order,
+            sort=sort,
+            filter=_json_dumps(filter_obj.to_dict()).decode("utf-8") if filter_obj else None,
+        )
+        return response
+
+    def iter_all_videos(
+        self,
+        collection_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        status: Optional[str] = None,
+        added_before: Optional[str] = None,
+        added_after: Optional[str] = None,
+        order: Optional[str] = None,
+        sort: Optional[str] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+    ):
+        """Iterate over all videos in a collection, fetching pages as needed.
 
+        Args:
+            collection_id: The ID of the collection
+            page_size: Number of videos requested per page (max 100)
+            status: Filter by processing status ('pending', 'processing', 'ready', 'failed')
+            added_before: Filter by videos added before a specific date, YYYY-MM-DD format in UTC
+            added_after: Filter by videos added after a specific date, YYYY-MM-DD format in UTC
+            order: Field to sort by ('created_at'). Defaults to 'created_at'
+            sort: Sort direction ('asc', 'desc'). Defaults to 'desc'
+            filter: Optional filter object or dictionary, see list_videos().
+
+        Yields:
+            CollectionFile objects
+
+        Raises:
+            CloudglueError: If there is an error listing the videos or processing the request.
+        """
+        yield from _paginate(
+            self.list_videos,
+            page_size,
+            collection_id=collection_id,
+            status=status,
+            added_before=added_before,
+            added_after=added_after,
+            order=order,
+            sort=sort,
+            filter=filter,
+        )
+
+    def count_videos(
+        self,
+        collection_id: str,
+        status: Optional[str] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+    ) -> int:
+        """Count videos in a collection.
+
+        Args:
+            collection_id: The ID of the collection
+            status: Filter by processing status ('pending', 'processing', 'ready', 'failed')
+            filter: Optional filter object or dictionary, see list_videos().
+
+        Returns:
+            The total number of matching videos
+
+        Raises:
+            CloudglueError: If there is an error listing the videos or processing the request.
+        """
+        return self.list_videos(
+            collection_id=collection_id, limit=1, status=status, filter=filter
+        ).total
+
+    @_wrap_api_errors
     def remove_video(self, collection_id: str, file_id: str):
         """Remove a video from a collection.
 
@@ -397,17 +588,13 @@ class Collections:
         Raises:
             CloudglueError: If there is an error removing the video or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.delete_video(
-                collection_id=collection_id, file_id=file_id
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.delete_video(
+            collection_id=collection_id, file_id=file_id
+        )
+        return response
 
+    @_wrap_api_errors
     def get_rich_transcripts(
         self,
         collection_id: str,
@@ -431,17 +618,13 @@ class Collections:
         Raises:
             CloudglueError: If there is an error retrieving the rich transcript or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_transcripts(
-                collection_id=collection_id, file_id=file_id, start_time_seconds=start_time_seconds, end_time_seconds=end_time_seconds, response_format=response_format
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.get_transcripts(
+            collection_id=collection_id, file_id=file_id, start_time_seconds=start_time_seconds, end_time_seconds=end_time_seconds, response_format=response_format
+        )
+        return response
 
+    @_wrap_api_errors
     def get_video_entities(
         self,
         collection_id: str,
@@ -469,22 +652,17 @@ class Collections:
         Raises:
             CloudglueError: If there is an error retrieving the entities or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_entities(
-                collection_id=collection_id,
-                file_id=file_id,
-                limit=limit,
-                offset=offset,
-                include_thumbnails=include_thumbnails,
-                include_chapters=include_chapters,
-                include_shots=include_shots,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.get_entities(
+            collection_id=collection_id,
+            file_id=file_id,
+            limit=limit,
+            offset=offset,
+            include_thumbnails=include_thumbnails,
+            include_chapters=include_chapters,
+            include_shots=include_shots,
+        )
+        return response
 
     def list_entities(
         self,
@@ -583,6 +761,7 @@ class Collections:
                 f"Failed to list rich transcripts in collection {collection_id}: {str(e)}"
             )
 
+    @_wrap_api_errors
     def get_media_descriptions(
         self,
         collection_id: str,
@@ -614,16 +793,11 @@ class Collections:
         Raises:
             CloudglueError: If there is an error retrieving the media descriptions or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_media_descriptions(
-                collection_id=collection_id, file_id=file_id, start_time_seconds=start_time_seconds, end_time_seconds=end_time_seconds, response_format=response_format, include_thumbnails=include_thumbnails, include_word_timestamps=include_word_timestamps, include_chapters=include_chapters, include_shots=include_shots
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Use the standard method to get a properly typed object
+        response = self.api.get_media_descriptions(
+            collection_id=collection_id, file_id=file_id, start_time_seconds=start_time_seconds, end_time_seconds=end_time_seconds, response_format=response_format, include_thumbnails=include_thumbnails, include_word_timestamps=include_word_timestamps, include_chapters=include_chapters, include_shots=include_shots
+        )
+        return response
 
     def list_media_descriptions(
         self,
@@ -713,6 +887,7 @@ class Collections:
                 f"Failed to get face detections for file {file_id} in collection {collection_id}: {str(e)}"
             )
 
+    @_wrap_api_errors
     def add_media(
         self,
         collection_id: str,
@@ -723,6 +898,8 @@ class Collections:
         wait_until_finish: bool = False,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Add a media file (video or audio) to a collection.
 
@@ -743,8 +920,10 @@ class Collections:
             segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
             segmentation_config: Configuration for segmentation. Cannot be provided together with segmentation_id.
             wait_until_finish: Whether to wait for the processing to complete
-            poll_interval: How often to check the status (in seconds) if waiting
+            poll_interval: Maximum interval between status checks (in seconds) if waiting
             timeout: Maximum time to wait for processing (in seconds) if waiting
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
 
         Returns:
             The typed CollectionFile object with association details. If wait_until_finish
@@ -752,55 +931,50 @@ class Collections:
 
         Raises:
             CloudglueError: If there is an error adding the media or processing the request.
+            TimeoutError: If wait_until_finish is True and processing does not complete within the timeout.
         """
-        try:
-            # Validate that either file_id or url is provided
-            if not file_id and not url:
-                raise CloudglueError("Either file_id or url must be provided")
-
-            if segmentation_id and segmentation_config:
-                raise ValueError("Cannot provide both segmentation_id and segmentation_config")
-
-            # Handle segmentation_config parameter
-            if isinstance(segmentation_config, dict):
-                segmentation_config = SegmentationConfig.from_dict(segmentation_config)
-
-            # Create request object
-            request = AddCollectionFile(
-                file_id=file_id,
-                url=url,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-            )
-
-            response = self.api.add_media(
-                collection_id=collection_id, add_collection_file=request
-            )
-
-            # If not waiting for completion, return immediately
-            if not wait_until_finish:
-                return response
-
-            # Otherwise poll until completion or timeout
-            response_file_id = response.file_id
-            elapsed = 0
-            terminal_states = ["ready", "completed", "failed", "not_applicable"]
-
-            while elapsed < timeout:
-                status = self.get_video(collection_id=collection_id, file_id=response_file_id)
-
-                if status.status in terminal_states:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+        # Validate that either file_id or url is provided
+        if not file_id and not url:
+            raise CloudglueError("Either file_id or url must be provided")
+
+        if segmentation_id and segmentation_config:
+            raise ValueError("Cannot provide both segmentation_id and segmentation_config")
+
+        # Handle segmentation_config parameter
+        if isinstance(segmentation_config, dict):
+            segmentation_config = SegmentationConfig.from_dict(segmentation_config)
+
+        # Create request object
+        request = AddCollectionFile(
+            file_id=file_id,
+            url=url,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+        )
+
+        response = self.api.add_media(
+            collection_id=collection_id, add_collection_file=request
+        )
+
+        # If not waiting for completion, return immediately
+        if not wait_until_finish:
+            return response
 
-            raise TimeoutError(
-                f"Media processing did not complete within {timeout} seconds"
-            )
+        # Otherwise poll until completion or timeout
+        response_file_id = response.file_id
+        get_video = _ConditionalGet(
+            self.api.api_client,
+            self.api.get_video_without_preload_content,
+            "CollectionFile",
+            _FILE_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_video(collection_id=collection_id, file_id=response_file_id),
+            lambda status: status.status in _FILE_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Media processing",
+            initial=response,
+            cancel_event=cancel_event,
+        )
 
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
 
@@ -1,7 +1,5 @@
 # cloudglue/client/resources/data_connectors.py
 """Data Connectors resource for Cloudglue API."""
-from typing import Optional
-
 from cloudglue.sdk.rest import ApiException
 
 from cloudglue.client.resources.base import CloudglueError
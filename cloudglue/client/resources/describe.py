@@ -1,23 +1,37 @@
 # cloudglue/client/resources/describe.py
 """Describe resource for Cloudglue API."""
-import time
+import threading
+from concurrent.futures import Executor
 from typing import Dict, Any, List, Optional, Union
 
 from cloudglue.sdk.models.new_describe import NewDescribe
 from cloudglue.sdk.models.segmentation_config import SegmentationConfig
 from cloudglue.sdk.models.thumbnails_config import ThumbnailsConfig
-from cloudglue.sdk.rest import ApiException
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import _map_concurrently, _wrap_api_errors
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _ConditionalGet,
+    _JOB_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class Describe:
     """Handles media description operations."""
 
-    def __init__(self, api):
-        """Initialize with the API client."""
+    def __init__(self, api, executor: Optional[Executor] = None):
+        """Initialize with the API client.
+
+        Args:
+            api: The generated Describe API client.
+            executor: Optional thread pool shared by concurrent helpers such as create_many().
+        """
         self.api = api
+        self._executor = executor
 
+    @_wrap_api_errors
     def create(
         self,
         url: str,
@@ -49,42 +63,125 @@ class Describe:
         Raises:
             CloudglueError: If there is an error creating the describe job or processing the request.
         """
-        try:
-            if segmentation_id and segmentation_config:
-                raise ValueError("Cannot provide both segmentation_id and segmentation_config")
-
-            # Handle segmentation_config parameter
-            if isinstance(segmentation_config, dict):
-                segmentation_config = SegmentationConfig.from_dict(segmentation_config)
-
-            # Handle thumbnails_config parameter
-            thumbnails_config_obj = None
-            if thumbnails_config is not None:
-                if isinstance(thumbnails_config, dict):
-                    thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
-                else:
-                    thumbnails_config_obj = thumbnails_config
-
-            request = NewDescribe(
-                url=url,
-                enable_summary=enable_summary,
-                enable_speech=enable_speech,
-                enable_scene_text=enable_scene_text,
-                enable_visual_scene_description=enable_visual_scene_description,
-                enable_audio_description=enable_audio_description,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-                thumbnails_config=thumbnails_config_obj,
-            )
-
-            # Use the regular SDK method to create the job
-            response = self.api.create_describe(new_describe=request)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        request = self._build_request(
+            url=url,
+            enable_summary=enable_summary,
+            enable_speech=enable_speech,
+            enable_scene_text=enable_scene_text,
+            enable_visual_scene_description=enable_visual_scene_description,
+            enable_audio_description=enable_audio_description,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+
+        # Use the regular SDK method to create the job
+        response = self.api.create_describe(new_describe=request)
+        return response
+
+    @staticmethod
+    def _build_request(
+        url: str,
+        enable_summary: bool = True,
+        enable_speech: bool = True,
+        enable_scene_text: bool = True,
+        enable_visual_scene_description: bool = True,
+        enable_audio_description: bool = True,
+        segmentation_id: Optional[str] = None,
+        segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
+        thumbnails_config: Optional[Union[Dict[str, Any], Any]] = None,
+    ) -> NewDescribe:
+        """Validate the arguments of create() and build the request object."""
+        if segmentation_id and segmentation_config:
+            raise ValueError("Cannot provide both segmentation_id and segmentation_config")
+
+        # Handle segmentation_config parameter
+        if isinstance(segmentation_config, dict):
+            segmentation_config = SegmentationConfig.from_dict(segmentation_config)
+
+        # Handle thumbnails_config parameter
+        thumbnails_config_obj = None
+        if thumbnails_config is not None:
+            if isinstance(thumbnails_config, dict):
+                thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
+            else:
+                thumbnails_config_obj = thumbnails_config
+
+        return NewDescribe(
+            url=url,
+            enable_summary=enable_summary,
+            enable_speech=enable_speech,
+            enable_scene_text=enable_scene_text,
+            enable_visual_scene_description=enable_visual_scene_description,
+            enable_audio_description=enable_audio_description,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config_obj,
+        )
+
+    @_wrap_api_errors
+    def create_many(
+        self,
+        urls: List[str],
+        enable_summary: bool = True,
+        enable_speech: bool = True,
+        enable_scene_text: bool = True,
+        enable_visual_scene_description: bool = True,
+        enable_audio_description: bool = True,
+        segmentation_id: Optional[str] = None,
+        segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
+        thumbnails_config: Optional[Union[Dict[str, Any], Any]] = None,
+        max_concurrency: int = 10,
+    ) -> List[Any]:
+        """Create one media description job per URL, all with the same settings.
+
+        The settings are converted and validated once; the request for each URL is a copy
+        of that validated request with only the URL replaced. Up to max_concurrency
+        requests are sent at the same time.
 
+        Args:
+            urls: Input video URLs. Can be YouTube URLs or URIs of uploaded files.
+            enable_summary: Whether to generate video-level and segment-level summaries and titles.
+            enable_speech: Whether to generate speech transcript.
+            enable_scene_text: Whether to generate scene text extraction.
+            enable_visual_scene_description: Whether to generate visual scene description.
+            enable_audio_description: Whether to generate audio description.
+            segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
+            segmentation_config: Configuration for video segmentation. Cannot be provided together with segmentation_id.
+            thumbnails_config: Optional configuration for segment thumbnails
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The typed Describe job objects, in the order of urls.
+
+        Raises:
+            CloudglueError: If there is an error creating any of the describe jobs.
+        """
+        if not urls:
+            return []
+        for url in urls:
+            if not isinstance(url, str):
+                raise ValueError(f"urls must be strings, got {type(url).__name__}")
+
+        template = self._build_request(
+            url=urls[0],
+            enable_summary=enable_summary,
+            enable_speech=enable_speech,
+            enable_scene_text=enable_scene_text,
+            enable_visual_scene_description=enable_visual_scene_description,
+            enable_audio_description=enable_audio_description,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+        return _map_concurrently(
+            lambda url: self.api.create_describe(new_describe=template.model_copy(update={"url": url})),
+            urls,
+            max_concurrency,
+            self._executor,
+        )
+
+    @_wrap_api_errors
     def get(
         self,
         job_id: str,
@@ -116,25 +213,21 @@ class Describe:
         Raises:
             CloudglueError: If there is an error retrieving the describe job or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.get_describe(
-                job_id=job_id,
-                response_format=response_format,
-                start_time_seconds=start_time_seconds,
-                end_time_seconds=end_time_seconds,
-                modalities=modalities,
-                include_thumbnails=include_thumbnails,
-                include_word_timestamps=include_word_timestamps,
-                include_chapters=include_chapters,
-                include_shots=include_shots,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        # Use the standard method to get a properly typed object
+        response = self.api.get_describe(
+            job_id=job_id,
+            response_format=response_format,
+            start_time_seconds=start_time_seconds,
+            end_time_seconds=end_time_seconds,
+            modalities=modalities,
+            include_thumbnails=include_thumbnails,
+            include_word_timestamps=include_word_timestamps,
+            include_chapters=include_chapters,
+            include_shots=include_shots,
+        )
+        return response
+
+    @_wrap_api_errors
     def list(
         self,
         limit: Optional[int] = None,
@@ -165,24 +258,20 @@ class Describe:
         Raises:
             CloudglueError: If there is an error retrieving the describe jobs or processing the request.
         """
-        try:
-            # Use the standard method to get a properly typed object
-            response = self.api.list_describes(
-                limit=limit,
-                offset=offset,
-                status=status,
-                created_before=created_before,
-                created_after=created_after,
-                response_format=response_format,
-                url=url,
-                include_data=include_data,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        # Use the standard method to get a properly typed object
+        response = self.api.list_describes(
+            limit=limit,
+            offset=offset,
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+            response_format=response_format,
+            url=url,
+            include_data=include_data,
+        )
+        return response
+
+    @_wrap_api_errors
     def delete(self, job_id: str):
         """Delete a media description job.
 
@@ -195,14 +284,10 @@ class Describe:
         Raises:
             CloudglueError: If there is an error deleting the description job.
         """
-        try:
-            response = self.api.delete_describe(job_id=job_id)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.delete_describe(job_id=job_id)
+        return response
 
+    @_wrap_api_errors
     def run(
         self,
         url: str,
@@ -222,13 +307,17 @@ class Describe:
         include_word_timestamps: Optional[bool] = None,
         include_chapters: Optional[bool] = None,
         include_shots: Optional[bool] = None,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Create a media description job and wait for it to complete.
 
         Args:
             url: Input video URL. Can be YouTube URLs or URIs of uploaded files.
-            poll_interval: Seconds between status checks.
+            poll_interval: Maximum seconds between status checks.
             timeout: Total seconds to wait before giving up.
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
             enable_summary: Whether to generate video-level and segment-level summaries and titles.
             enable_speech: Whether to generate speech transcript.
             enable_scene_text: Whether to generate scene text extraction.
@@ -249,40 +338,36 @@ class Describe:
 
         Raises:
             CloudglueError: If there is an error creating or processing the describe job.
+            TimeoutError: If the job does not complete within the specified timeout.
         """
-        try:
-            # Create the job
-            job = self.create(
-                url=url,
-                enable_summary=enable_summary,
-                enable_speech=enable_speech,
-                enable_scene_text=enable_scene_text,
-                enable_visual_scene_description=enable_visual_scene_description,
-                enable_audio_description=enable_audio_description,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-                thumbnails_config=thumbnails_config,
-            )
-
-            job_id = job.job_id
-
-            # Poll for completion
-            elapsed = 0
-            while elapsed < timeout:
-                status = self.get(job_id=job_id, response_format=response_format, modalities=modalities, include_thumbnails=include_thumbnails, include_word_timestamps=include_word_timestamps, include_chapters=include_chapters, include_shots=include_shots)
-
-                if status.status in ["completed", "failed"]:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            raise TimeoutError(
-                f"Describe job did not complete within {timeout} seconds"
-            )
-
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Create the job
+        job = self.create(
+            url=url,
+            enable_summary=enable_summary,
+            enable_speech=enable_speech,
+            enable_scene_text=enable_scene_text,
+            enable_visual_scene_description=enable_visual_scene_description,
+            enable_audio_description=enable_audio_description,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+
+        job_id = job.job_id
+
+        # Poll for completion
+        get_describe = _ConditionalGet(
+            self.api.api_client,
+            self.api.get_describe_without_preload_content,
+            "Describe",
+            _JOB_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_describe(job_id=job_id, response_format=response_format, modalities=modalities, include_thumbnails=include_thumbnails, include_word_timestamps=include_word_timestamps, include_chapters=include_chapters, include_shots=include_shots),
+            lambda status: status.status in _JOB_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Describe job",
+            cancel_event=cancel_event,
+        )
+
 
@@ -1,27 +1,37 @@
 # cloudglue/client/resources/extract.py
 """Extract resource for Cloudglue API."""
-import time
-from typing import Dict, Any, Optional, Union
+import threading
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Union
 
 from cloudglue.sdk.models.new_extract import NewExtract
 from cloudglue.sdk.models.segmentation_config import SegmentationConfig
 from cloudglue.sdk.models.thumbnails_config import ThumbnailsConfig
-from cloudglue.sdk.rest import ApiException
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import _map_concurrently, _wrap_api_errors
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _ConditionalGet,
+    _JOB_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class Extract:
     """Client for the Cloudglue Extract API."""
 
-    def __init__(self, api):
+    def __init__(self, api, executor: Optional[Executor] = None):
         """Initialize the Extract client.
 
         Args:
             api: The DefaultApi instance.
+            executor: Optional thread pool shared by concurrent helpers such as create_many().
         """
         self.api = api
+        self._executor = executor
 
+    @_wrap_api_errors
     def create(
         self,
         url: str,
@@ -51,45 +61,123 @@ class Extract:
         Raises:
             CloudglueError: If there is an error creating the extraction job or processing the request.
         """
-        try:
-            if not prompt and not schema:
-                raise ValueError("Either prompt or schema must be provided")
-
-            if segmentation_id and segmentation_config:
-                raise ValueError("Cannot provide both segmentation_id and segmentation_config")
-
-            # Handle segmentation_config parameter
-            if isinstance(segmentation_config, dict):
-                segmentation_config = SegmentationConfig.from_dict(segmentation_config)
-
-            # Handle thumbnails_config parameter
-            thumbnails_config_obj = None
-            if thumbnails_config is not None:
-                if isinstance(thumbnails_config, dict):
-                    thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
-                else:
-                    thumbnails_config_obj = thumbnails_config
-
-            # Set up the request object
-            request = NewExtract(
-                url=url,
-                prompt=prompt,
-                var_schema=schema,
-                enable_video_level_entities=enable_video_level_entities,
-                enable_segment_level_entities=enable_segment_level_entities,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-                thumbnails_config=thumbnails_config_obj,
-            )
-
-            # Use the standard method to get a properly typed Extract object
-            response = self.api.create_extract(new_extract=request)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        request = self._build_request(
+            url=url,
+            prompt=prompt,
+            schema=schema,
+            enable_video_level_entities=enable_video_level_entities,
+            enable_segment_level_entities=enable_segment_level_entities,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+
+        # Use the standard method to get a properly typed Extract object
+        response = self.api.create_extract(new_extract=request)
+        return response
+
+    @staticmethod
+    def _build_request(
+        url: str,
+        prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        enable_video_level_entities: Optional[bool] = None,
+        enable_segment_level_entities: Optional[bool] = None,
+        segmentation_id: Optional[str] = None,
+        segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
+        thumbnails_config: Optional[Union[Dict[str, Any], Any]] = None,
+    ) -> NewExtract:
+        """Validate the arguments of create() and build the request object."""
+        if not prompt and not schema:
+            raise ValueError("Either prompt or schema must be provided")
+
+        if segmentation_id and segmentation_config:
+            raise ValueError("Cannot provide both segmentation_id and segmentation_config")
+
+        # Handle segmentation_config parameter
+        if isinstance(segmentation_config, dict):
+            segmentation_config = SegmentationConfig.from_dict(segmentation_config)
+
+        # Handle thumbnails_config parameter
+        thumbnails_config_obj = None
+        if thumbnails_config is not None:
+            if isinstance(thumbnails_config, dict):
+                thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
+            else:
+                thumbnails_config_obj = thumbnails_config
+
+        # Set up the request object
+        return NewExtract(
+            url=url,
+            prompt=prompt,
+            var_schema=schema,
+            enable_video_level_entities=enable_video_level_entities,
+            enable_segment_level_entities=enable_segment_level_entities,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config_obj,
+        )
+
+    @_wrap_api_errors
+    def create_many(
+        self,
+        urls: List[str],
+        prompt: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        enable_video_level_entities: Optional[bool] = None,
+        enable_segment_level_entities: Optional[bool] = None,
+        segmentation_id: Optional[str] = None,
+        segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
+        thumbnails_config: Optional[Union[Dict[str, Any], Any]] = None,
+        max_concurrency: int = 10,
+    ) -> List[Any]:
+        """Create one extraction job per URL, all with the same settings.
 
+        The settings are converted and validated once; the request for each URL is a copy
+        of that validated request with only the URL replaced. Up to max_concurrency
+        requests are sent at the same time.
+
+        Args:
+            urls: The URLs of the videos to extract data from.
+            prompt: A natural language description of what to extract. Required if schema is not provided.
+            schema: A JSON schema defining the structure of the data to extract. Required if prompt is not provided.
+            enable_video_level_entities: Whether to extract entities at the video level
+            enable_segment_level_entities: Whether to extract entities at the segment level
+            segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
+            segmentation_config: Configuration for video segmentation. Cannot be provided together with segmentation_id.
+            thumbnails_config: Optional configuration for segment thumbnails
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            List[Extract]: The created jobs, in the order of urls.
+
+        Raises:
+            CloudglueError: If there is an error creating any of the extraction jobs.
+        """
+        if not urls:
+            return []
+        for url in urls:
+            if not isinstance(url, str):
+                raise ValueError(f"urls must be strings, got {type(url).__name__}")
+
+        template = self._build_request(
+            url=urls[0],
+            prompt=prompt,
+            schema=schema,
+            enable_video_level_entities=enable_video_level_entities,
+            enable_segment_level_entities=enable_segment_level_entities,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+        return _map_concurrently(
+            lambda url: self.api.create_extract(new_extract=template.model_copy(update={"url": url})),
+            urls,
+            max_concurrency,
+            self._executor,
+        )
+
+    @_wrap_api_errors
     def get(
         self,
         job_id: str,
@@ -114,14 +202,10 @@ class Extract:
         Raises:
             CloudglueError: If there is an error retrieving the extraction job or processing the request.
         """
-        try:
-            response = self.api.get_extract(job_id=job_id, limit=limit, offset=offset, include_thumbnails=include_thumbnails, include_chapters=include_chapters, include_shots=include_shots)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.get_extract(job_id=job_id, limit=limit, offset=offset, include_thumbnails=include_thumbnails, include_chapters=include_chapters, include_shots=include_shots)
+        return response
         
+    @_wrap_api_errors
     def list(
         self,
         limit: Optional[int] = None,
@@ -150,21 +234,17 @@ class Extract:
         Raises:
             CloudglueError: If there is an error listing the extraction jobs or processing the request.
         """
-        try:
-            return self.api.list_extracts(
-                limit=limit,
-                offset=offset,
-                status=status,
-                created_before=created_before,
-                created_after=created_after,
-                url=url,
-                include_data=include_data,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        return self.api.list_extracts(
+            limit=limit,
+            offset=offset,
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+            url=url,
+            include_data=include_data,
+        )
+
+    @_wrap_api_errors
     def delete(self, job_id: str):
         """Delete an extraction job.
 
@@ -177,14 +257,10 @@ class Extract:
         Raises:
             CloudglueError: If there is an error deleting the extraction job.
         """
-        try:
-            response = self.api.delete_extract(job_id=job_id)
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.delete_extract(job_id=job_id)
+        return response
 
+    @_wrap_api_errors
     def run(
         self,
         url: str,
@@ -200,6 +276,8 @@ class Extract:
         include_thumbnails: Optional[bool] = None,
         include_chapters: Optional[bool] = None,
         include_shots: Optional[bool] = None,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Create an extraction job and wait for it to complete.
 
@@ -212,8 +290,10 @@ class Extract:
             segmentation_id: Segmentation job id to use. Cannot be provided together with segmentation_config.
             segmentation_config: Configuration for video segmentation. Cannot be provided together with segmentation_id.
             thumbnails_config: Optional configuration for segment thumbnails
-            poll_interval: How often to check the job status (in seconds).
+            poll_interval: Maximum interval between job status checks (in seconds).
             timeout: Maximum time to wait for the job to complete (in seconds).
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
             include_thumbnails: When true, include thumbnail_url on the data object and segment entities
             include_chapters: When true, include narrative chapters in the response (when segmentation strategy is 'narrative')
             include_shots: When true, include shot boundaries in the response (when segmentation strategy is 'shot-detector')
@@ -223,37 +303,33 @@ class Extract:
 
         Raises:
             CloudglueError: If there is an error creating or processing the extraction job.
+            TimeoutError: If the job does not complete within the specified timeout.
         """
-        try:
-            # Create the extraction job
-            job = self.create(
-                url=url,
-                prompt=prompt,
-                schema=schema,
-                enable_video_level_entities=enable_video_level_entities,
-                enable_segment_level_entities=enable_segment_level_entities,
-                segmentation_id=segmentation_id,
-                segmentation_config=segmentation_config,
-                thumbnails_config=thumbnails_config,
-            )
-            job_id = job.job_id
-
-            # Poll for completion
-            elapsed = 0
-            while elapsed < timeout:
-                status = self.get(job_id=job_id, include_thumbnails=include_thumbnails, include_chapters=include_chapters, include_shots=include_shots)
-
-                if status.status in ["completed", "failed"]:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            raise TimeoutError(
-                f"Extraction job did not complete within {timeout} seconds"
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Create the extraction job
+        job = self.create(
+            url=url,
+            prompt=prompt,
+            schema=schema,
+            enable_video_level_entities=enable_video_level_entities,
+            enable_segment_level_entities=enable_segment_level_entities,
+            segmentation_id=segmentation_id,
+            segmentation_config=segmentation_config,
+            thumbnails_config=thumbnails_config,
+        )
+        job_id = job.job_id
+
+        # Poll for completion
+        get_extract = _ConditionalGet(
+            self.api.api_client,
+            self.api.get_extract_without_preload_content,
+            "Extract",
+            _JOB_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_extract(job_id=job_id, include_thumbnails=include_thumbnails, include_chapters=include_chapters, include_shots=include_shots),
+            lambda status: status.status in _JOB_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Extraction job",
+            cancel_event=cancel_event,
+        )
 
@@ -1,6 +1,6 @@
 # cloudglue/client/resources/face_detection.py
 """Face Detection resource for Cloudglue API."""
-import time
+import threading
 from typing import Dict, Any, Optional, Union
 
 from cloudglue.sdk.models.face_detection_request import FaceDetectionRequest
@@ -8,6 +8,12 @@ from cloudglue.sdk.models.frame_extraction_config import FrameExtractionConfig
 from cloudglue.sdk.rest import ApiException
 
 from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _JOB_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class FaceDetection:
@@ -174,6 +180,8 @@ class FaceDetection:
         frame_extraction_config: Optional[Union[FrameExtractionConfig, Dict[str, Any]]] = None,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
         **kwargs
     ):
         """Create and run a face detection job to completion.
@@ -182,8 +190,10 @@ class FaceDetection:
             url: URL of the target video to analyze
             frame_extraction_id: Optional ID of previously extracted frames
             frame_extraction_config: Optional frame extraction configuration
-            poll_interval: How often to check the job status (in seconds)
+            poll_interval: Maximum interval between job status checks (in seconds)
             timeout: Maximum time to wait for the job to complete (in seconds)
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
             **kwargs: Additional parameters for the request
 
         Returns:
@@ -205,19 +215,15 @@ class FaceDetection:
             face_detection_id = job.face_detection_id
 
             # Poll for completion
-            elapsed = 0
-            while elapsed < timeout:
-                status = self.get(face_detection_id=face_detection_id)
-
-                if status.status in ["completed", "failed"]:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            raise TimeoutError(
-                f"Face detection job did not complete within {timeout} seconds"
+            return _poll(
+                lambda: self.get(face_detection_id=face_detection_id),
+                lambda status: status.status in _JOB_TERMINAL_STATES,
+                _resolve_poll_settings(poll_settings, poll_interval, timeout),
+                description="Face detection job",
+                cancel_event=cancel_event,
             )
+        except TimeoutError:
+            raise
         except ApiException as e:
             raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
         except Exception as e:
@@ -1,11 +1,15 @@
 # cloudglue/client/resources/files.py
 """Files resource for Cloudglue API."""
+import io
 import json
+import mimetypes
 import os
-import pathlib
-import time
+import threading
 from typing import List, Dict, Any, Optional, Union
 
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary, encode_multipart_formdata
+
 from cloudglue.sdk.models.file_update import FileUpdate
 from cloudglue.sdk.models.segmentation_config import SegmentationConfig
 from cloudglue.sdk.models.search_filter import SearchFilter
@@ -13,14 +17,105 @@ from cloudglue.sdk.models.search_filter_criteria import SearchFilterCriteria
 from cloudglue.sdk.models.search_filter_file_inner import SearchFilterFileInner
 from cloudglue.sdk.models.search_filter_video_info_inner import SearchFilterVideoInfoInner
 from cloudglue.sdk.models.thumbnails_config import ThumbnailsConfig
+from cloudglue.sdk.api.frames_api import FramesApi
 from cloudglue.sdk.api.segmentations_api import SegmentationsApi
 from cloudglue.sdk.models.create_file_segmentation_request import CreateFileSegmentationRequest
 from cloudglue.sdk.models.frame_extraction_uniform_config import FrameExtractionUniformConfig
 from cloudglue.sdk.models.frame_extraction_thumbnails_config import FrameExtractionThumbnailsConfig
 from cloudglue.sdk.models.create_file_frame_extraction_request import CreateFileFrameExtractionRequest
-from cloudglue.sdk.rest import ApiException
+from cloudglue.sdk.rest import RESTResponse
+
+from cloudglue.client.resources.base import CloudglueError, _json_dumps, _wrap_api_errors
+from cloudglue.client.resources.pagination import MAX_PAGE_SIZE, _paginate
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _ConditionalGet,
+    _FILE_TERMINAL_STATES,
+    _JOB_TERMINAL_STATES,
+    _SEGMENTATION_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
+
+# Bytes read from disk per write to the socket during uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Mirrors FilesApi.upload_file
+_UPLOAD_RESPONSE_TYPES = {
+    '200': "File",
+    '400': "Error",
+    '415': "Error",
+    '429': "Error",
+    '500': "Error",
+}
+
+
+class _MultipartFileBody:
+    """multipart/form-data request body that streams one file from disk.
+
+    The form fields and the file part headers are encoded up front, while the file
+    content is read in ``chunk_size`` blocks as urllib3 writes the body, so memory use
+    does not grow with the file size. Blocks are read into one reusable buffer and
+    handed to the socket as memoryviews, which is safe because urllib3 sends each block
+    completely before asking for the next one. ``tell()`` and ``seek()`` let urllib3
+    rewind the body when it retries the request.
+    """
+
+    def __init__(self, fields, name, filename, fileobj, chunk_size):
+        boundary = choose_boundary()
+        closing = f"--{boundary}--\r\n".encode()
+        # The encoded fields end with the closing delimiter, which has to follow the file
+        fields_body, _ = encode_multipart_formdata(fields, boundary=boundary)
+
+        part = RequestField(name=name, data=b"", filename=filename)
+        part.make_multipart(
+            content_type=mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
 
-from cloudglue.client.resources.base import CloudglueError
+        self._head = (
+            fields_body[: -len(closing)]
+            + f"--{boundary}\r\n".encode()
+            + part.render_headers().encode()
+        )
+        self._tail = b"\r\n" + closing
+        self._fileobj = fileobj
+        self._file_start = fileobj.tell()
+        self._file_size = os.fstat(fileobj.fileno()).st_size - self._file_start
+        self._chunk_size = chunk_size
+        self._pos = 0
+
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.content_length = len(self._head) + self._file_size + len(self._tail)
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        # urllib3 only rewinds to an offset it got from tell()
+        self._pos = pos
+        return pos
+
+    def __iter__(self):
+        head_end = len(self._head)
+        file_end = head_end + self._file_size
+
+        if self._pos < head_end:
+            yield self._head[self._pos:]
+            self._pos = head_end
+
+        if self._pos < file_end:
+            self._fileobj.seek(self._file_start + self._pos - head_end)
+            buffer = memoryview(bytearray(min(self._chunk_size, self._file_size)))
+            while self._pos < file_end:
+                n = self._fileobj.readinto(buffer[: file_end - self._pos])
+                if not n:
+                    raise IOError("File was truncated during upload")
+                yield buffer[:n]
+                self._pos += n
+
+        if self._pos < self.content_length:
+            yield self._tail[self._pos - file_end:]
+            self._pos = self.content_length
 
 
 class Files:
@@ -192,6 +287,7 @@ class Files:
             file=file,
         )
 
+    @_wrap_api_errors
     def upload(
         self,
         file_path: str,
@@ -200,16 +296,25 @@ class Files:
         wait_until_finish: bool = False,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
     ):
         """Upload a file to Cloudglue.
 
+        The file is streamed from disk, so files larger than the available memory can be
+        uploaded.
+
         Args:
             file_path: Path to the local file to upload.
             metadata: Optional user-provided metadata about the file.
             enable_segment_thumbnails: Whether to generate thumbnails for each segment.
             wait_until_finish: Whether to wait for the file processing to complete.
-            poll_interval: How often to check the file status (in seconds) if waiting.
+            poll_interval: Maximum interval between file status checks (in seconds) if waiting.
             timeout: Maximum time to wait for processing (in seconds) if waiting.
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
+            chunk_size: Number of bytes read from the file per write to the connection.
 
         Returns:
             The uploaded file object. If wait_until_finish is True, waits for processing
@@ -217,52 +322,90 @@ class Files:
 
         Raises:
             CloudglueError: If there is an error uploading or processing the file.
+            TimeoutError: If wait_until_finish is True and processing does not complete within the timeout.
         """
+        # Opening directly instead of checking exists() first saves a stat call and
+        # cannot race with the file being removed in between.
+        # Unbuffered, so file blocks are read straight into the upload buffer.
         try:
-            file_path = pathlib.Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            # Read the file as bytes and create a tuple of (filename, bytes)
-            with open(file_path, "rb") as f:
-                file_bytes = f.read()
-
-            filename = os.path.basename(file_path)
-            file_tuple = (filename, file_bytes)
-
-            response = self.api.upload_file(
-                file=file_tuple, 
+            f = open(file_path, "rb", buffering=0)
+        except FileNotFoundError:
+            raise CloudglueError(f"File not found: {file_path}")
+
+        filename = os.path.basename(file_path)
+        with f:
+            response = self._upload_stream(
+                f,
+                filename,
                 metadata=metadata,
-                enable_segment_thumbnails=enable_segment_thumbnails
+                enable_segment_thumbnails=enable_segment_thumbnails,
+                chunk_size=chunk_size,
             )
 
-            # If not waiting for completion, return immediately
-            if not wait_until_finish:
-                return response
-
-            # Otherwise poll until completion or timeout
-            file_id = response.id
-            elapsed = 0
-            terminal_states = ["ready", "completed", "failed", "not_applicable"]
+        # If not waiting for completion, return immediately
+        if not wait_until_finish:
+            return response
 
-            while elapsed < timeout:
-                status = self.get(file_id=file_id)
+        # Otherwise poll until completion or timeout
+        file_id = response.id
+        get_file = _ConditionalGet(
+            self.api.api_client,
+            self.api.get_file_without_preload_content,
+            "File",
+            _FILE_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_file(file_id=file_id),
+            lambda status: status.status in _FILE_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="File processing",
+            initial=response,
+            cancel_event=cancel_event,
+        )
 
-                if status.status in terminal_states:
-                    return status
 
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+    def _upload_stream(
+        self,
+        fileobj,
+        filename: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        enable_segment_thumbnails: Optional[bool] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        """Send an upload request whose body is streamed from an open binary file.
 
-            raise TimeoutError(
-                f"File processing did not complete within {timeout} seconds"
+        ``FilesApi.upload_file`` only accepts the file content as bytes, so the request is
+        serialized by the generated client without the file and sent with a streaming
+        multipart body on the same connection pool.
+        """
+        method, url, headers, _, fields = self.api._upload_file_serialize(
+            file=None,
+            metadata=metadata,
+            enable_segment_thumbnails=enable_segment_thumbnails,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        # Same form field encoding as the generated REST client
+        fields = [(k, json.dumps(v)) if isinstance(v, dict) else (k, v) for k, v in fields]
+        body = _MultipartFileBody(fields, "file", filename, fileobj, chunk_size)
+        headers["Content-Type"] = body.content_type
+        headers["Content-Length"] = str(body.content_length)
+
+        api_client = self.api.api_client
+        response_data = RESTResponse(
+            api_client.rest_client.pool_manager.request(
+                method, url, body=body, headers=headers, preload_content=False
             )
+        )
+        response_data.read()
+        return api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_UPLOAD_RESPONSE_TYPES,
+        ).data
 
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+    @_wrap_api_errors
     def list(
         self,
         status: Optional[str] = None,
@@ -293,31 +436,94 @@ class Files:
         Raises:
             CloudglueError: If there is an error listing files or processing the request.
         """
-        try:
-            # Convert filter dict to SearchFilter object if needed
-            filter_obj = None
-            if filter is not None:
-                if isinstance(filter, dict):
-                    # Convert dict to SearchFilter object
-                    filter_obj = SearchFilter(**filter)
-                else:
-                    filter_obj = filter
-
-            return self.api.list_files(
-                status=status,
-                created_before=created_before,
-                created_after=created_after,
-                limit=limit,
-                offset=offset,
-                order=order,
-                sort=sort,
-                filter=json.dumps(filter_obj.to_dict()) if filter_obj else None,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Convert filter dict to SearchFilter object if needed
+        filter_obj = None
+        if filter is not None:
+            if isinstance(filter, dict):
+                # Convert dict to SearchFilter object
+                filter_obj = SearchFilter(**filter)
+            else:
+                filter_obj = filter
+
+        return self.api.list_files(
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+            limit=limit,
+            offset=offset,
+            order=order,
+            sort=sort,
+            filter=_json_dumps(filter_obj.to_dict()).decode("utf-8") if filter_obj else None,
+        )
+
+    def iter_all(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        status: Optional[str] = None,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        order: Optional[str] = None,
+        sort: Optional[str] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+    ):
+        """Iterate over all files, fetching pages as needed.
+
+        Args:
+            page_size: Number of files requested per page (max 100).
+            status: Optional filter by file status ('processing', 'ready', 'failed').
+            created_before: Optional filter by files created before a specific date, YYYY-MM-DD format in UTC
+            created_after: Optional filter by files created after a specific date, YYYY-MM-DD format in UTC
+            order: Optional field to sort by ('created_at', 'filename'). Defaults to 'created_at'.
+            sort: Optional sort direction ('asc', 'desc'). Defaults to 'desc'.
+            filter: Optional filter object or dictionary, see list().
+
+        Yields:
+            File objects.
 
+        Raises:
+            CloudglueError: If there is an error listing files or processing the request.
+        """
+        yield from _paginate(
+            self.list,
+            page_size,
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+            order=order,
+            sort=sort,
+            filter=filter,
+        )
+
+    def count(
+        self,
+        status: Optional[str] = None,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+    ) -> int:
+        """Count files.
+
+        Args:
+            status: Optional filter by file status ('processing', 'ready', 'failed').
+            created_before: Optional filter by files created before a specific date, YYYY-MM-DD format in UTC
+            created_after: Optional filter by files created after a specific date, YYYY-MM-DD format in UTC
+            filter: Optional filter object or dictionary, see list().
+
+        Returns:
+            The total number of matching files.
+
+        Raises:
+            CloudglueError: If there is an error listing files or processing the request.
+        """
+        return self.list(
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+            limit=1,
+            filter=filter,
+        ).total
+
+    @_wrap_api_errors
     def get(self, file_id: str):
         """Get details about a specific file.
 
@@ -330,13 +536,9 @@ class Files:
         Raises:
             CloudglueError: If there is an error retrieving the file or processing the request.
         """
-        try:
-            return self.api.get_file(file_id=file_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.get_file(file_id=file_id)
 
+    @_wrap_api_errors
     def delete(self, file_id: str):
         """Delete a file.
 
@@ -349,13 +551,9 @@ class Files:
         Raises:
             CloudglueError: If there is an error deleting the file or processing the request.
         """
-        try:
-            return self.api.delete_file(file_id=file_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.delete_file(file_id=file_id)
 
+    @_wrap_api_errors
     def update(
         self,
         file_id: str,
@@ -375,19 +573,15 @@ class Files:
         Raises:
             CloudglueError: If there is an error updating the file or processing the request.
         """
-        try:
-            # Create the update request object
-            file_update = FileUpdate(
-                filename=filename,
-                metadata=metadata,
-            )
-            
-            return self.api.update_file(file_id=file_id, file_update=file_update)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        # Create the update request object
+        file_update = FileUpdate(
+            filename=filename,
+            metadata=metadata,
+        )
+        
+        return self.api.update_file(file_id=file_id, file_update=file_update)
 
+    @_wrap_api_errors
     def create_segmentation(
         self,
         file_id: str,
@@ -396,6 +590,8 @@ class Files:
         wait_until_finish: bool = False,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Create a new segmentation for a file.
 
@@ -404,8 +600,10 @@ class Files:
             segmentation_config: Segmentation configuration (SegmentationConfig object or dictionary)
             thumbnails_config: Optional configuration for segment thumbnails
             wait_until_finish: Whether to wait for the segmentation to complete
-            poll_interval: How often to check the segmentation status (in seconds) if waiting
+            poll_interval: Maximum interval between segmentation status checks (in seconds) if waiting
             timeout: Maximum time to wait for processing (in seconds) if waiting
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
 
         Returns:
             The created Segmentation object. If wait_until_finish is True, waits for processing
@@ -413,6 +611,7 @@ class Files:
 
         Raises:
             CloudglueError: If there is an error creating the segmentation or processing the request.
+            TimeoutError: If wait_until_finish is True and the segmentation does not complete within the timeout.
 
         Example:
             # Create uniform segmentation
@@ -423,68 +622,58 @@ class Files:
                 wait_until_finish=True
             )
         """
-        try:            
-            # Handle segmentation_config parameter
-            if isinstance(segmentation_config, dict):
-                segmentation_config = SegmentationConfig.from_dict(segmentation_config)
-            elif not isinstance(segmentation_config, SegmentationConfig):
-                raise ValueError("segmentation_config must be a SegmentationConfig object or dictionary")
-
-            # Handle thumbnails_config parameter
-            thumbnails_config_obj = None
-            if thumbnails_config is not None:
-                if isinstance(thumbnails_config, dict):
-                    thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
-                else:
-                    thumbnails_config_obj = thumbnails_config
-
-            # Create the request object
-            request = CreateFileSegmentationRequest(
-                strategy=segmentation_config.strategy,
-                uniform_config=segmentation_config.uniform_config,
-                shot_detector_config=segmentation_config.shot_detector_config,
-                manual_config=segmentation_config.manual_config,
-                keyframe_config=segmentation_config.keyframe_config,
-                start_time_seconds=segmentation_config.start_time_seconds,
-                end_time_seconds=segmentation_config.end_time_seconds,
-                thumbnails_config=thumbnails_config_obj,
-            )
-
-            response = self.api.create_file_segmentation(
-                file_id=file_id,
-                create_file_segmentation_request=request,
-            )
-
-            # If not waiting for completion, return immediately
-            if not wait_until_finish:
-                return response
-
-            # Otherwise poll until completion or timeout
-            segmentation_id = response.segmentation_id
-            elapsed = 0
-            terminal_states = ["completed", "failed", "not_applicable"]
+        # Handle segmentation_config parameter
+        if isinstance(segmentation_config, dict):
+            segmentation_config = SegmentationConfig.from_dict(segmentation_config)
+        elif not isinstance(segmentation_config, SegmentationConfig):
+            raise ValueError("segmentation_config must be a SegmentationConfig object or dictionary")
+
+        # Handle thumbnails_config parameter
+        thumbnails_config_obj = None
+        if thumbnails_config is not None:
+            if isinstance(thumbnails_config, dict):
+                thumbnails_config_obj = ThumbnailsConfig.from_dict(thumbnails_config)
+            else:
+                thumbnails_config_obj = thumbnails_config
+
+        # Create the request object
+        request = CreateFileSegmentationRequest(
+            strategy=segmentation_config.strategy,
+            uniform_config=segmentation_config.uniform_config,
+            shot_detector_config=segmentation_config.shot_detector_config,
+            manual_config=segmentation_config.manual_config,
+            keyframe_config=segmentation_config.keyframe_config,
+            start_time_seconds=segmentation_config.start_time_seconds,
+            end_time_seconds=segmentation_config.end_time_seconds,
+            thumbnails_config=thumbnails_config_obj,
+        )
 
-            # Import SegmentationsApi here to avoid circular imports            
-            segmentations_api = SegmentationsApi(self.api.api_client)
+        response = self.api.create_file_segmentation(
+            file_id=file_id,
+            create_file_segmentation_request=request,
+        )
 
-            while elapsed < timeout:
-                status = segmentations_api.get_segmentation(segmentation_id=segmentation_id)
+        # If not waiting for completion, return immediately
+        if not wait_until_finish:
+            return response
 
-                if status.status in terminal_states:
-                    return status
+        # Otherwise poll until completion or timeout
+        segmentation_id = response.segmentation_id
 
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+        # Import SegmentationsApi here to avoid circular imports            
+        segmentations_api = SegmentationsApi(self.api.api_client)
 
-            raise TimeoutError(
-                f"Segmentation processing did not complete within {timeout} seconds"
-            )
+        return _poll(
+            lambda: segmentations_api.get_segmentation(segmentation_id=segmentation_id),
+            lambda status: status.status in _SEGMENTATION_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Segmentation processing",
+            initial=response,
+            cancel_event=cancel_event,
+        )
 
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
 
+    @_wrap_api_errors
     def list_segmentations(
         self,
         file_id: str,
@@ -504,18 +693,14 @@ class Files:
         Raises:
             CloudglueError: If there is an error listing the segmentations or processing the request.
         """
-        try:
-            response = self.api.list_file_segmentations(
-                file_id=file_id,
-                limit=limit,
-                offset=offset,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.list_file_segmentations(
+            file_id=file_id,
+            limit=limit,
+            offset=offset,
+        )
+        return response
 
+    @_wrap_api_errors
     def get_thumbnails(
         self,
         file_id: str,
@@ -539,21 +724,17 @@ class Files:
         Returns:
             ThumbnailList response
         """
-        try:
-            response = self.api.get_thumbnails(
-                file_id=file_id,
-                is_default=is_default,
-                segmentation_id=segmentation_id,
-                limit=limit,
-                offset=offset,
-                type=type,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.get_thumbnails(
+            file_id=file_id,
+            is_default=is_default,
+            segmentation_id=segmentation_id,
+            limit=limit,
+            offset=offset,
+            type=type,
+        )
+        return response
 
+    @_wrap_api_errors
     def list_segments(
         self,
         file_id: str,
@@ -577,20 +758,16 @@ class Files:
         Raises:
             CloudglueError: If there is an error listing segments.
         """
-        try:
-            response = self.api.list_file_segments(
-                file_id=file_id,
-                start_time_after=start_time_after,
-                end_time_before=end_time_before,
-                limit=limit,
-                offset=offset,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.list_file_segments(
+            file_id=file_id,
+            start_time_after=start_time_after,
+            end_time_before=end_time_before,
+            limit=limit,
+            offset=offset,
+        )
+        return response
 
+    @_wrap_api_errors
     def list_frame_extractions(
         self,
         file_id: str,
@@ -610,18 +787,14 @@ class Files:
         Raises:
             CloudglueError: If there is an error listing frame extractions.
         """
-        try:
-            response = self.api.list_file_frame_extractions(
-                file_id=file_id,
-                limit=limit,
-                offset=offset,
-            )
-            return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        response = self.api.list_file_frame_extractions(
+            file_id=file_id,
+            limit=limit,
+            offset=offset,
+        )
+        return response
 
+    @_wrap_api_errors
     def create_frame_extraction(
         self,
         file_id: str,
@@ -633,6 +806,8 @@ class Files:
         wait_until_finish: bool = False,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Create a frame extraction job for a file.
 
@@ -644,73 +819,67 @@ class Files:
             start_time_seconds: Start time in seconds to begin extracting frames
             end_time_seconds: End time in seconds to stop extracting frames
             wait_until_finish: Whether to wait for the job to complete
-            poll_interval: How often to check the job status (in seconds)
+            poll_interval: Maximum interval between job status checks (in seconds) if waiting
             timeout: Maximum time to wait for the job to complete (in seconds)
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
 
         Returns:
-            FrameExtraction: The frame extraction job object
+            FrameExtraction: The frame extraction job object. If wait_until_finish is True,
+            the final state of the job.
 
         Raises:
             CloudglueError: If there is an error creating the frame extraction job
+            TimeoutError: If wait_until_finish is True and the job does not complete within the timeout.
         """
-        try:
-            # Convert config dicts to objects if needed
-            uniform_config_obj = None
-            if uniform_config is not None:
-                if isinstance(uniform_config, dict):
-                    uniform_config_obj = FrameExtractionUniformConfig(**uniform_config)
-                else:
-                    uniform_config_obj = uniform_config
-            
-            thumbnails_config_obj = None
-            if thumbnails_config is not None:
-                if isinstance(thumbnails_config, dict):
-                    thumbnails_config_obj = FrameExtractionThumbnailsConfig(**thumbnails_config)
-                else:
-                    thumbnails_config_obj = thumbnails_config
-
-            # Create the request object
-            request = CreateFileFrameExtractionRequest(
-                strategy=strategy,
-                uniform_config=uniform_config_obj,
-                thumbnails_config=thumbnails_config_obj,
-                start_time_seconds=start_time_seconds,
-                end_time_seconds=end_time_seconds
-            )
-
-            # Create the frame extraction job
-            response = self.api.create_file_frame_extraction(
-                file_id=file_id,
-                create_file_frame_extraction_request=request
-            )
+        # Convert config dicts to objects if needed
+        uniform_config_obj = None
+        if uniform_config is not None:
+            if isinstance(uniform_config, dict):
+                uniform_config_obj = FrameExtractionUniformConfig(**uniform_config)
+            else:
+                uniform_config_obj = uniform_config
+        
+        thumbnails_config_obj = None
+        if thumbnails_config is not None:
+            if isinstance(thumbnails_config, dict):
+                thumbnails_config_obj = FrameExtractionThumbnailsConfig(**thumbnails_config)
+            else:
+                thumbnails_config_obj = thumbnails_config
+
+        # Create the request object
+        request = CreateFileFrameExtractionRequest(
+            strategy=strategy,
+            uniform_config=uniform_config_obj,
+            thumbnails_config=thumbnails_config_obj,
+            start_time_seconds=start_time_seconds,
+            end_time_seconds=end_time_seconds
+        )
 
-            # If wait_until_finish is True, poll until completion
-            if wait_until_finish:
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    # Check if the job is complete
-                    if hasattr(response, 'status') and response.status in ['completed', 'failed']:
-                        break
-                    
-                    # Wait before checking again
-                    time.sleep(poll_interval)
-                    
-                    # Get updated status
-                    try:
-                        from cloudglue.client.main import Cloudglue
-                        client = Cloudglue()  # This is not ideal but we need access to frames API
-                        response = client.frames.get(response.id)
-                    except Exception:
-                        # If we can't get status, just return what we have
-                        break
-                        
-                # Check if we timed out
-                if hasattr(response, 'status') and response.status not in ['completed', 'failed']:
-                    raise CloudglueError(f"Frame extraction job timed out after {timeout} seconds")
+        # Create the frame extraction job
+        response = self.api.create_file_frame_extraction(
+            file_id=file_id,
+            create_file_frame_extraction_request=request
+        )
 
+        # If not waiting for completion, return immediately
+        if not wait_until_finish:
             return response
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+
+        # Otherwise poll until completion or timeout
+        frame_extraction_id = response.frame_extraction_id
+        get_frame_extraction = _ConditionalGet(
+            self.api.api_client,
+            FramesApi(self.api.api_client).get_frame_extraction_without_preload_content,
+            "FrameExtraction",
+            _JOB_TERMINAL_STATES,
+        )
+        return _poll(
+            lambda: get_frame_extraction(frame_extraction_id=frame_extraction_id),
+            lambda status: status.status in _JOB_TERMINAL_STATES,
+            _resolve_poll_settings(poll_settings, poll_interval, timeout),
+            description="Frame extraction job",
+            initial=response,
+            cancel_event=cancel_event,
+        )
 
@@ -0,0 +1,33 @@
+# cloudglue/client/resources/pagination.py
+"""Pagination helpers for Cloudglue list endpoints."""
+from typing import Any, Callable, Iterator
+
+# Largest page size accepted by the list endpoints
+MAX_PAGE_SIZE = 100
+
+
+def _paginate(
+    list_fn: Callable[..., Any], page_size: int = MAX_PAGE_SIZE, **kwargs
+) -> Iterator[Any]:
+    """Yield every item of an offset-paginated list endpoint.
+
+    Pages are requested lazily, so breaking out of the loop early skips the remaining
+    requests.
+
+    Args:
+        list_fn: Resource list method accepting ``limit`` and ``offset``.
+        page_size: Number of items requested per page.
+        **kwargs: Filters passed to every ``list_fn`` call.
+
+    Yields:
+        The items of each page, in the order returned by the API.
+    """
+    offset = 0
+    while True:
+        page = list_fn(limit=page_size, offset=offset, **kwargs)
+        items = page.data or []
+        yield from items
+
+        offset += len(items)
+        if len(items) < page_size or (page.total is not None and offset >= page.total):
+            return
@@ -0,0 +1,170 @@
+# cloudglue/client/resources/polling.py
+"""Polling helpers for waiting on long-running Cloudglue jobs."""
+import random
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Collection, Dict, Optional
+
+from cloudglue.client.resources.base import CloudglueError, _json_loads
+
+# Statuses after which a job no longer changes
+_JOB_TERMINAL_STATES = frozenset({"completed", "failed"})
+_SEGMENTATION_TERMINAL_STATES = frozenset({"completed", "failed", "not_applicable"})
+# Files and collection videos report "ready" once processed
+_FILE_TERMINAL_STATES = frozenset({"ready", "completed", "failed", "not_applicable"})
+
+
+@dataclass
+class PollSettings:
+    """Backoff strategy used while waiting for a job to reach a terminal state.
+
+    The first status check happens right away. If the job is not done yet, the client
+    waits ``initial_delay`` seconds, then multiplies the delay by ``multiplier`` after
+    every check up to ``max_delay``. Up to ``jitter`` extra seconds are added at random
+    so that many concurrent waiters do not poll in lockstep.
+
+    Attributes:
+        initial_delay: Seconds to wait before the second status check.
+        max_delay: Upper bound on the delay between two status checks.
+        multiplier: Factor applied to the delay after every status check.
+        jitter: Maximum random number of seconds added to each delay.
+        timeout: Total seconds to wait before giving up.
+    """
+
+    initial_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 1.5
+    jitter: float = 0.25
+    timeout: float = 600.0
+
+
+def _resolve_poll_settings(
+    poll_settings: Optional[PollSettings], poll_interval: float, timeout: float
+) -> PollSettings:
+    """Settings to use when a method accepts both ``poll_settings`` and the legacy arguments.
+
+    Without explicit settings, ``poll_interval`` caps the backoff and ``timeout`` bounds
+    the total wait.
+    """
+    if poll_settings is not None:
+        return poll_settings
+    return PollSettings(
+        initial_delay=min(PollSettings.initial_delay, poll_interval),
+        max_delay=poll_interval,
+        timeout=timeout,
+    )
+
+
+class _ConditionalGet:
+    """Status fetcher that skips unchanged responses while polling a job.
+
+    The ``ETag`` of the last response is sent back as ``If-None-Match``. When the API
+    answers 304 Not Modified, the previous result is returned without transferring or
+    parsing the body again. Responses without an ``ETag`` are fetched in full every time,
+    so this is a plain GET until the endpoint supports conditional requests.
+
+    While the job is still running only its ``status`` is read from the body; the typed
+    model is built once, from the response that reports a terminal state.
+    """
+
+    def __init__(
+        self,
+        api_client,
+        request_fn: Callable[..., Any],
+        response_type: str,
+        terminal_states: Collection[str],
+    ):
+        """Initialize with the API client and the endpoint's ``*_without_preload_content`` method.
+
+        Args:
+            api_client: Generated API client used to deserialize responses.
+            request_fn: Generated method returning the raw HTTP response.
+            response_type: Name of the model returned with status 200.
+            terminal_states: Statuses for which the full model is returned.
+        """
+        self._api_client = api_client
+        self._request_fn = request_fn
+        self._terminal_states = terminal_states
+        self._response_types: Dict[str, Optional[str]] = {
+            "200": response_type,
+            "4XX": "Error",
+            "5XX": "Error",
+        }
+        self._etag: Optional[str] = None
+        self._last: Any = None
+
+    def __call__(self, **kwargs) -> Any:
+        from cloudglue.sdk.rest import RESTResponse
+
+        headers = {"If-None-Match": self._etag} if self._etag is not None else None
+        response = RESTResponse(self._request_fn(_headers=headers, **kwargs))
+        response.read()
+        if response.status == 304:
+            return self._last
+
+        self._etag = response.getheader("ETag")
+        if response.status == 200:
+            status = _json_loads(response.data).get("status")
+            if status not in self._terminal_states:
+                self._last = SimpleNamespace(status=status)
+                return self._last
+
+        self._last = self._api_client.response_deserialize(
+            response_data=response, response_types_map=self._response_types
+        ).data
+        return self._last
+
+
+def _poll(
+    poll_fn: Callable[[], Any],
+    is_terminal: Callable[[Any], bool],
+    settings: PollSettings,
+    description: str = "Job",
+    initial: Any = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Any:
+    """Call ``poll_fn`` with exponential backoff until ``is_terminal`` accepts its result.
+
+    Args:
+        poll_fn: Fetches the current state of the job.
+        is_terminal: Returns True when the fetched state is final.
+        settings: Backoff and timeout settings.
+        description: Name of the job used in the timeout message.
+        initial: State already known to the caller, e.g. the create response. Returned
+            without polling if it is final.
+        cancel_event: Stops waiting as soon as it is set, instead of at the next check.
+
+    Returns:
+        The first result of ``poll_fn`` accepted by ``is_terminal``.
+
+    Raises:
+        TimeoutError: If the job does not reach a terminal state within ``settings.timeout``.
+        CloudglueError: If ``cancel_event`` is set before the job reaches a terminal state.
+    """
+    if initial is not None and is_terminal(initial):
+        return initial
+
+    deadline = time.monotonic() + settings.timeout
+    delay = settings.initial_delay
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CloudglueError(f"{description} was cancelled", reason="cancelled")
+        result = poll_fn()
+        if is_terminal(result):
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Never sleep past the deadline; the last check happens right at it
+        wait = min(delay + random.uniform(0, settings.jitter), remaining)
+        if cancel_event is not None:
+            cancel_event.wait(wait)
+        else:
+            time.sleep(wait)
+        delay = min(settings.max_delay, delay * settings.multiplier)
+
+    raise TimeoutError(
+        f"{description} did not complete within {settings.timeout} seconds"
+    )
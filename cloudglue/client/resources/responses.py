@@ -1,7 +1,11 @@
 # cloudglue/client/resources/responses.py
 """Responses resource for Cloudglue API."""
-import json
-from typing import List, Dict, Any, Optional, Union, Generator
+import gzip
+import hashlib
+import threading
+from concurrent.futures import Executor
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Generator, List, NamedTuple, Optional, Union
 
 from cloudglue.sdk.models.create_response_request import CreateResponseRequest
 from cloudglue.sdk.models.create_response_request_input import CreateResponseRequestInput
@@ -11,12 +15,57 @@ from cloudglue.sdk.models.response_input_content import ResponseInputContent
 from cloudglue.sdk.models.response_input_message import ResponseInputMessage
 from cloudglue.sdk.models.response_knowledge_base import ResponseKnowledgeBase
 from cloudglue.sdk.models.search_filter import SearchFilter
-from cloudglue.sdk.models.search_filter_file_inner import SearchFilterFileInner
-from cloudglue.sdk.models.search_filter_metadata_inner import SearchFilterMetadataInner
-from cloudglue.sdk.models.search_filter_video_info_inner import SearchFilterVideoInfoInner
-from cloudglue.sdk.rest import ApiException
+from cloudglue.sdk.rest import RESTResponse
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import (
+    CloudglueError,
+    _json_dumps,
+    _json_loads,
+    _map_concurrently_settled,
+    _wrap_api_errors,
+)
+from cloudglue.client.resources.cache import TTLCache
+from cloudglue.client.resources.pagination import MAX_PAGE_SIZE, _paginate
+
+
+# Messages in these shapes are built without re-running pydantic validation
+_MESSAGE_ROLES = frozenset({"developer", "user", "assistant"})
+_construct_message = ResponseInputMessage.model_construct
+_construct_content = ResponseInputContent.model_construct
+
+
+def _normalize_content(content: Dict[str, Any]) -> ResponseInputContent:
+    """Build a ResponseInputContent from a content dict, validating only unusual shapes."""
+    content_type = content.get("type", "input_text")
+    # A missing text is left to the validating constructor, which rejects it
+    text = content.get("text")
+    if content_type == "input_text" and type(text) is str:
+        return _construct_content(type=content_type, text=text)
+    return ResponseInputContent(type=content_type, text=text)
+
+
+def _wrap_text_content(text: str):
+    """Content list for a plain string message; always valid."""
+    return [_construct_content(type="input_text", text=text)], True
+
+
+def _normalize_content_list(content: list):
+    """Normalize a list of content parts; also report whether all parts are known-valid."""
+    normalized = []
+    append = normalized.append
+    valid = True
+    for part in content:
+        part_type = type(part)
+        if part_type is dict:
+            part = _normalize_content(part)
+        elif part_type is not ResponseInputContent:
+            valid = False
+        append(part)
+    return normalized, valid
+
+
+# Content normalizers keyed by the exact type of a message's content
+_CONTENT_HANDLERS = {str: _wrap_text_content, list: _normalize_content_list}
 
 
 def _normalize_input(input: Union[str, List[Dict[str, Any]]]) -> CreateResponseRequestInput:
@@ -26,89 +75,389 @@ def _normalize_input(input: Union[str, List[Dict[str, Any]]]) -> CreateResponseR
         - A plain string: "What does amy talk about"
         - A list of simple message dicts: [{"role": "user", "content": "Hello"}]
         - A list of fully-structured message dicts matching the API schema
+
+    Messages and text content with the standard types and roles are known to be valid,
+    so they skip model validation; anything else goes through the validating constructors.
+
+    Raises:
+        CloudglueError: If input is neither a string nor a list of messages.
+        ValueError: If a message or content part is malformed, e.g. has no role.
     """
     if isinstance(input, str):
         return CreateResponseRequestInput(input)
+    if not isinstance(input, list):
+        raise CloudglueError("input must be a string or a list of message dicts")
 
     # Normalize list of message dicts into ResponseInputMessage objects
     messages = []
+    append_message = messages.append
+    get_handler = _CONTENT_HANDLERS.get
     for msg in input:
-        # If content is a plain string, wrap it in the expected structure
+        if type(msg) is not dict:
+            # Message objects pass, anything else is rejected with a ValidationError
+            append_message(ResponseInputMessage.model_validate(msg))
+            continue
         content = msg.get("content")
-        if isinstance(content, str):
-            content = [ResponseInputContent(type="input_text", text=content)]
-        elif isinstance(content, list):
-            content = [
-                ResponseInputContent(type=c.get("type", "input_text"), text=c["text"])
-                if isinstance(c, dict) else c
-                for c in content
-            ]
-        messages.append(ResponseInputMessage(
-            type=msg.get("type", "message"),
-            role=msg["role"],
-            content=content,
-        ))
+        handler = get_handler(type(content))
+        if handler is None:
+            valid = False
+        else:
+            content, valid = handler(content)
+
+        message_type = msg.get("type", "message")
+        role = msg.get("role")
+        if valid and message_type == "message" and role in _MESSAGE_ROLES:
+            append_message(_construct_message(type=message_type, role=role, content=content))
+        else:
+            append_message(ResponseInputMessage(type=message_type, role=role, content=content))
     return CreateResponseRequestInput(messages)
 
 
-def _iter_sse_events(raw_response) -> Generator[Dict[str, Any], None, None]:
+class SSEEvent(NamedTuple):
+    """One event of a streamed response.
+
+    Events are read as attributes (``event.data``). For code written against the
+    earlier dict events, ``event["data"]``, ``event.get("data")``, ``"data" in event``,
+    ``event.keys()`` and ``dict(event)`` still work. Iterating over an event, ``len()``
+    and ``==`` follow tuple semantics, so an event no longer equals a dict.
+
+    Attributes:
+        event: Event name, or None if the event has none.
+        data: JSON-parsed payload, or the raw text if it is not JSON, e.g. "[DONE]".
+    """
+
+    event: Optional[str]
+    data: Any
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+    def keys(self):
+        """Return the field names, like the keys of the earlier dict events."""
+        return self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field named ``key``, or ``default`` if there is none."""
+        return getattr(self, key) if key in self._fields else default
+
+
+# Marks the end of a prefetched event stream
+_STREAM_END = object()
+
+
+def _prefetch_events(events: Generator, prefetch: int) -> Generator[SSEEvent, None, None]:
+    """Read ``events`` ahead of the caller from a background thread.
+
+    Up to ``prefetch`` events are buffered, so the connection keeps being read while the
+    caller works on an event. Errors raised while reading are re-raised to the caller.
+
+    Closing this generator early makes the reader stop at its next event, and it then
+    closes ``events``, which releases the connection. A reader waiting for room in the
+    buffer notices within about 100 ms, but one blocked reading the socket only stops
+    once the server sends more data or the read times out.
+    """
+    buffered = Queue(maxsize=prefetch)
+    abandoned = threading.Event()
+
+    def put(item) -> bool:
+        # Wake up periodically so an abandoned stream does not block the reader forever
+        while not abandoned.is_set():
+            try:
+                buffered.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for event in events:
+                if not put((event, None)):
+                    return
+            put((_STREAM_END, None))
+        except BaseException as e:
+            # Always hand over the end marker, or the caller would wait forever
+            put((_STREAM_END, e))
+        finally:
+            events.close()
+
+    threading.Thread(target=read, name="cloudglue-sse", daemon=True).start()
+    try:
+        while True:
+            event, error = buffered.get()
+            if event is _STREAM_END:
+                if error is not None:
+                    raise error
+                return
+            yield event
+    finally:
+        abandoned.set()
+
+
+def _criteria_list(criteria: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Treat a single filter criterion dict as a one-element list."""
+    if isinstance(criteria, dict):
+        return [criteria]
+    return criteria
+
+
+# Bytes requested from the stream per read
+_SSE_READ_SIZE = 16384
+# Parsed lines are dropped from the front of the buffer once they exceed this size
+_SSE_COMPACT_THRESHOLD = 64 * 1024
+
+
+def _parse_sse_data(data_lines: List[bytes]) -> Union[Dict[str, Any], str]:
+    """Join the data lines of one SSE event and JSON-parse them when possible."""
+    raw_data = b"\n".join(data_lines)
+    if raw_data == b"[DONE]":
+        return "[DONE]"
+    try:
+        # Parsed straight from bytes; orjson and json both raise ValueError subclasses
+        return _json_loads(raw_data)
+    except ValueError:
+        return raw_data.decode("utf-8")
+
+
+def _iter_sse_events(raw_response) -> Generator[SSEEvent, None, None]:
     """Parse SSE events from a raw urllib3.HTTPResponse.
 
-    Yields dicts with shape {'event': str|None, 'data': dict|str}.
-    The data field is JSON-parsed when possible; the [DONE] sentinel is yielded as-is.
+    Yields an SSEEvent per event. The data field is JSON-parsed when possible; the [DONE] sentinel is yielded as-is.
+
+    Lines are split on the raw bytes and only event names and finished data payloads
+    are decoded, so multi-byte characters split across reads are handled and the cost
+    stays linear in the size of the stream.
     """
-    buffer = ""
+    buffer = bytearray()
+    start = 0
     current_event = None
     current_data_lines = []
+    # Bound once; the buffer and the data line list are only ever modified in place
+    find = buffer.find
+    append_data_line = current_data_lines.append
+    parse_data = _parse_sse_data
+    # Skips the keyword handling of SSEEvent.__new__
+    make_event = SSEEvent._make
+
+    try:
+        for chunk in raw_response.stream(amt=_SSE_READ_SIZE, decode_content=True):
+            buffer += chunk
+
+            while True:
+                end = find(b"\n", start)
+                if end == -1:
+                    break
+                line = buffer[start:end].rstrip(b"\r")
+                start = end + 1
+
+                if line.startswith(b"data:"):
+                    append_data_line(line[5:].strip())
+                elif line.startswith(b"event:"):
+                    current_event = line[6:].strip().decode("utf-8")
+                elif not line:
+                    # Empty line signals end of an SSE event
+                    if current_data_lines:
+                        yield make_event((current_event, parse_data(current_data_lines)))
+                        current_data_lines.clear()
+                    current_event = None
+
+            if start > _SSE_COMPACT_THRESHOLD:
+                del buffer[:start]
+                start = 0
+
+        # Handle any remaining data in buffer after stream ends
+        if current_data_lines:
+            yield SSEEvent(current_event, parse_data(current_data_lines))
+    finally:
+        # Hand the connection back to the pool. A stream abandoned midway still holds
+        # unread data, so closing it first makes the pool open a fresh connection.
+        raw_response.close()
+        raw_response.release_conn()
+
+
+def _iter_ndjson_events(raw_response) -> Generator[SSEEvent, None, None]:
+    """Parse newline-delimited JSON events from a raw urllib3.HTTPResponse.
+
+    Yields SSEEvents like _iter_sse_events, with the event name taken
+    from the 'type' field of each JSON object. The stream simply ends after the
+    last event; there is no [DONE] sentinel.
+    """
+    buffer = bytearray()
+    start = 0
+    find = buffer.find
+    loads = _json_loads
+    make_event = SSEEvent._make
+
+    try:
+        for chunk in raw_response.stream(amt=_SSE_READ_SIZE, decode_content=True):
+            buffer += chunk
+
+            while True:
+                end = find(b"\n", start)
+                if end == -1:
+                    break
+                line = buffer[start:end].strip()
+                start = end + 1
+                if line:
+                    data = loads(line)
+                    yield make_event((data.get("type"), data))
+
+            if start > _SSE_COMPACT_THRESHOLD:
+                del buffer[:start]
+                start = 0
+
+        line = buffer[start:].strip()
+        if line:
+            data = loads(line)
+            yield SSEEvent(data.get("type"), data)
+    finally:
+        raw_response.close()
+        raw_response.release_conn()
+
+
+# Media type of newline-delimited JSON event streams
+_NDJSON_CONTENT_TYPE = "application/x-ndjson"
+# Sent with transport="ndjson"; servers without NDJSON support still answer with SSE
+_NDJSON_ACCEPT = f"{_NDJSON_CONTENT_TYPE}, text/event-stream;q=0.9"
+_STREAM_TRANSPORTS = ("sse", "ndjson")
+
+
+def _iter_stream_events(raw_response) -> Generator[SSEEvent, None, None]:
+    """Parse a streamed response as NDJSON or SSE, depending on its Content-Type."""
+    content_type = raw_response.headers.get("Content-Type", "")
+    if content_type.startswith(_NDJSON_CONTENT_TYPE):
+        return _iter_ndjson_events(raw_response)
+    return _iter_sse_events(raw_response)
+
+
+def _build_knowledge_base(
+    collections: List[str],
+    knowledge_base_type: Optional[str],
+    filter: Optional[Union[SearchFilter, Dict[str, Any]]],
+    entity_backed_knowledge_config: Optional[Union[EntityBackedKnowledgeConfig, Dict[str, Any]]],
+) -> ResponseKnowledgeBase:
+    """Build the knowledge base of a create() request, converting dict arguments."""
+    kb_kwargs = {"collections": collections}
+    if knowledge_base_type is not None:
+        kb_kwargs["type"] = knowledge_base_type
+    if filter is not None:
+        kb_kwargs["filter"] = SearchFilter.from_dict(filter) if isinstance(filter, dict) else filter
+    if entity_backed_knowledge_config is not None:
+        kb_kwargs["entity_backed_knowledge_config"] = (
+            EntityBackedKnowledgeConfig.from_dict(entity_backed_knowledge_config)
+            if isinstance(entity_backed_knowledge_config, dict)
+            else entity_backed_knowledge_config
+        )
+    return ResponseKnowledgeBase(**kb_kwargs)
 
-    for chunk in raw_response.stream(amt=4096, decode_content=True):
-        if isinstance(chunk, bytes):
-            chunk = chunk.decode("utf-8")
-        buffer += chunk
-
-        while "\n" in buffer:
-            line, buffer = buffer.split("\n", 1)
-            line = line.rstrip("\r")
-
-            if line.startswith("event:"):
-                current_event = line[len("event:"):].strip()
-            elif line.startswith("data:"):
-                current_data_lines.append(line[len("data:"):].strip())
-            elif line == "":
-                # Empty line signals end of an SSE event
-                if current_data_lines:
-                    raw_data = "\n".join(current_data_lines)
-                    if raw_data == "[DONE]":
-                        parsed_data = raw_data
-                    else:
-                        try:
-                            parsed_data = json.loads(raw_data)
-                        except json.JSONDecodeError:
-                            parsed_data = raw_data
-                    yield {"event": current_event, "data": parsed_data}
-                current_event = None
-                current_data_lines = []
-
-    # Handle any remaining data in buffer after stream ends
-    if current_data_lines:
-        raw_data = "\n".join(current_data_lines)
-        if raw_data == "[DONE]":
-            parsed_data = raw_data
-        else:
-            try:
-                parsed_data = json.loads(raw_data)
-            except json.JSONDecodeError:
-                parsed_data = raw_data
-        yield {"event": current_event, "data": parsed_data}
+
+# Finished responses no longer change; they are cached for at most an hour, and never
+# longer than the cache's own ttl
+_FINISHED_RESPONSE_STATES = frozenset({"completed", "failed", "cancelled"})
+_FINISHED_RESPONSE_TTL = 3600.0
+# Highest temperature at which create() results are considered repeatable
+_CACHEABLE_MAX_TEMPERATURE = 0.2
+
+
+# Smallest create() request body that is gzip-compressed when compression is on
+_COMPRESS_MIN_BYTES = 2048
+
+# Same response types as ResponseApi.create_response
+_CREATE_RESPONSE_TYPES: Dict[str, Optional[str]] = {
+    "200": "Response",
+    "400": "Error",
+    "404": "Error",
+    "500": "Error",
+}
 
 
 class Responses:
     """Handles response operations for the Cloudglue API."""
 
-    def __init__(self, api):
-        """Initialize with the API client."""
+    def __init__(
+        self,
+        api,
+        cache: Optional[TTLCache] = None,
+        create_cache: Optional[TTLCache] = None,
+        executor: Optional[Executor] = None,
+        compress_requests: bool = False,
+    ):
+        """Initialize with the API client.
+
+        Args:
+            api: The generated Response API client.
+            cache: Optional cache for get() results, keyed by response ID.
+            create_cache: Optional cache for create() results, keyed by a hash of the
+                full request. Only low-temperature, non-streaming requests are cached.
+            executor: Optional thread pool shared by concurrent helpers such as delete_many().
+            compress_requests: Gzip create() request bodies of at least 2 KB, e.g. long
+                multi-turn inputs, and accept gzip-compressed responses.
+        """
         self.api = api
+        self._cache = cache
+        self._create_cache = create_cache
+        self._executor = executor
+        self._compress_requests = compress_requests
 
+    def _create_cache_key(self, request: CreateResponseRequest) -> Optional[str]:
+        """Cache key for a create() request, or None if its result should not be reused.
+
+        The key covers the whole request as sent, including every message of a
+        multi-turn input, so a follow-up question only hits for the same conversation.
+        """
+        if (
+            self._create_cache is None
+            or request.stream
+            or request.background
+            or request.include
+            or request.temperature is None
+            or request.temperature > _CACHEABLE_MAX_TEMPERATURE
+        ):
+            return None
+        body = self.api.api_client.sanitize_for_serialization(request)
+        return hashlib.sha256(_json_dumps(body, sort_keys=True)).hexdigest()
+
+    def _post_compressed(
+        self,
+        request: CreateResponseRequest,
+        stream: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> RESTResponse:
+        """Send a create() request whose body is gzip-compressed if it is large enough.
+
+        The generated REST client always sends JSON bodies as text, so the request is
+        serialized by the generated client and sent on the same connection pool.
+        Streamed events are not compressed, so they are passed on as soon as they arrive.
+        """
+        method, url, headers, body, _ = self.api._create_response_serialize(
+            create_response_request=request,
+            _request_auth=None,
+            _content_type=None,
+            _headers=headers,
+            _host_index=0,
+        )
+        data = _json_dumps(body)
+        if len(data) >= _COMPRESS_MIN_BYTES:
+            data = gzip.compress(data, compresslevel=1, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        if not stream:
+            headers["Accept-Encoding"] = "gzip"
+        return RESTResponse(
+            self.api.api_client.rest_client.pool_manager.request(
+                method, url, body=data, headers=headers, preload_content=False
+            )
+        )
+
+    @_wrap_api_errors
     def create(
         self,
         input: Union[str, List[Dict[str, Any]]],
@@ -120,8 +469,12 @@ class Responses:
         include: Optional[List[str]] = None,
         stream: Optional[bool] = None,
         knowledge_base_type: Optional[str] = None,
-        entity_backed_knowledge_config: Optional[Dict[str, Any]] = None,
-        filter: Optional[Dict[str, Any]] = None,
+        entity_backed_knowledge_config: Optional[
+            Union[EntityBackedKnowledgeConfig, Dict[str, Any]]
+        ] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        prefetch: Optional[int] = None,
+        transport: str = "sse",
     ):
         """Create a new response.
 
@@ -137,30 +490,95 @@ class Responses:
             stream: Set to True to stream the response via SSE. Mutually exclusive with background.
             knowledge_base_type: The type of knowledge base interaction pattern.
                 'general_question_answering' (default) or 'entity_backed_knowledge'.
-            entity_backed_knowledge_config: Configuration for entity-backed knowledge.
-                Required when knowledge_base_type is 'entity_backed_knowledge'.
-            filter: Optional filter to narrow down the search within collections.
+            entity_backed_knowledge_config: Configuration for entity-backed knowledge, as a
+                dict or an EntityBackedKnowledgeConfig. Required when knowledge_base_type is
+                'entity_backed_knowledge'.
+            filter: Optional filter to narrow down the search within collections, as a
+                dict or a SearchFilter from create_filter(). To send the same filter with
+                many requests, build it once with create_filter() and pass the object,
+                which is used as is.
+            prefetch: With stream=True, read up to this many events ahead in a background
+                thread, so a slow consumer does not stall the connection.
+            transport: With stream=True, 'ndjson' asks the server for newline-delimited
+                JSON events, which are cheaper to parse than SSE. Servers that only stream
+                SSE answer with SSE, which is parsed as usual. Defaults to 'sse'.
 
         Returns:
-            The Response object, or a generator of SSE event dicts when stream=True.
+            The Response object, or a generator of SSEEvent tuples when stream=True.
 
         Raises:
             CloudglueError: If there is an error creating the response.
         """
-        try:
-            kb_kwargs = {"collections": collections}
-            if knowledge_base_type is not None:
-                kb_kwargs["type"] = knowledge_base_type
-            if filter is not None:
-                kb_kwargs["filter"] = SearchFilter.from_dict(filter) if isinstance(filter, dict) else filter
-            if entity_backed_knowledge_config is not None:
-                kb_kwargs["entity_backed_knowledge_config"] = (
-                    EntityBackedKnowledgeConfig.from_dict(entity_backed_knowledge_config)
-                    if isinstance(entity_backed_knowledge_config, dict)
-                    else entity_backed_knowledge_config
-                )
-            knowledge_base = ResponseKnowledgeBase(**kb_kwargs)
+        knowledge_base = _build_knowledge_base(
+            collections, knowledge_base_type, filter, entity_backed_knowledge_config
+        )
+        request = CreateResponseRequest(
+            input=_normalize_input(input),
+            model=model,
+            knowledge_base=knowledge_base,
+            instructions=instructions,
+            temperature=temperature,
+            background=background,
+            include=include,
+            stream=stream,
+        )
+        return self._send_create(request, prefetch, transport)
 
+    @_wrap_api_errors
+    def specialize(
+        self,
+        collections: List[str],
+        model: str = "nimbus-001",
+        temperature: Optional[float] = None,
+        include: Optional[List[str]] = None,
+        knowledge_base_type: Optional[str] = None,
+        entity_backed_knowledge_config: Optional[
+            Union[EntityBackedKnowledgeConfig, Dict[str, Any]]
+        ] = None,
+        filter: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+    ) -> Callable[..., Any]:
+        """Bind the create() arguments that stay the same across many calls.
+
+        The knowledge base, including its filter, is built and validated once, so each
+        call only normalizes its input and wraps it in a request. Useful when asking
+        many questions against the same collections.
+
+        Args:
+            collections: List of collection IDs to search for relevant context.
+            model: The model to use for the responses (default: 'nimbus-001').
+            temperature: Sampling temperature for the model (0-2, default: 0.7).
+            include: Additional data to include in the response annotations.
+            knowledge_base_type: The type of knowledge base interaction pattern.
+            entity_backed_knowledge_config: Configuration for entity-backed knowledge.
+            filter: Optional filter to narrow down the search within collections.
+
+        Returns:
+            A function ``call(input, *, instructions=None, background=None, stream=None,
+            prefetch=None, transport='sse')`` that behaves like create() with the bound
+            arguments.
+
+        Raises:
+            CloudglueError: If the filter or knowledge base configuration is invalid.
+
+        Example:
+            ask = client.responses.specialize(collections=[collection_id], temperature=0)
+            answers = [ask(question) for question in questions]
+        """
+        knowledge_base = _build_knowledge_base(
+            collections, knowledge_base_type, filter, entity_backed_knowledge_config
+        )
+        send_create = self._send_create
+
+        @_wrap_api_errors
+        def call(
+            input: Union[str, List[Dict[str, Any]]],
+            *,
+            instructions: Optional[str] = None,
+            background: Optional[bool] = None,
+            stream: Optional[bool] = None,
+            prefetch: Optional[int] = None,
+            transport: str = "sse",
+        ):
             request = CreateResponseRequest(
                 input=_normalize_input(input),
                 model=model,
@@ -171,28 +589,56 @@ class Responses:
                 include=include,
                 stream=stream,
             )
+            return send_create(request, prefetch, transport)
+
+        return call
 
-            if stream:
+    def _send_create(
+        self, request: CreateResponseRequest, prefetch: Optional[int], transport: str
+    ):
+        """Send a create() request, or return its cached result."""
+        if transport not in _STREAM_TRANSPORTS:
+            raise ValueError(f"transport must be one of {', '.join(_STREAM_TRANSPORTS)}")
+
+        cache_key = self._create_cache_key(request)
+        if cache_key is not None:
+            cached = self._create_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        if request.stream:
+            headers = {"Accept": _NDJSON_ACCEPT} if transport == "ndjson" else None
+            if self._compress_requests:
+                raw_response = self._post_compressed(request, stream=True, headers=headers).response
+            else:
                 raw_response = self.api.create_response_without_preload_content(
-                    create_response_request=request
+                    create_response_request=request, _headers=headers
                 )
-                if raw_response.status != 200:
-                    error_body = raw_response.read().decode("utf-8")
-                    raise CloudglueError(
-                        f"({raw_response.status})\nReason: {raw_response.reason}\n"
-                        f"HTTP response body: {error_body}",
-                        raw_response.status,
-                    )
-                return _iter_sse_events(raw_response)
+            if raw_response.status != 200:
+                error_body = raw_response.read().decode("utf-8")
+                raise CloudglueError(
+                    f"({raw_response.status})\nReason: {raw_response.reason}\n"
+                    f"HTTP response body: {error_body}",
+                    raw_response.status,
+                )
+            events = _iter_stream_events(raw_response)
+            if prefetch:
+                return _prefetch_events(events, prefetch)
+            return events
+        else:
+            if self._compress_requests:
+                response_data = self._post_compressed(request, stream=False)
+                response_data.read()
+                response = self.api.api_client.response_deserialize(
+                    response_data=response_data, response_types_map=_CREATE_RESPONSE_TYPES
+                ).data
             else:
-                return self.api.create_response(create_response_request=request)
-        except CloudglueError:
-            raise
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+                response = self.api.create_response(create_response_request=request)
+            if cache_key is not None and response.status == "completed":
+                self._create_cache.set(cache_key, response.model_copy(deep=True))
+            return response
 
+    @_wrap_api_errors
     def get(self, response_id: str):
         """Get a specific response by ID.
 
@@ -200,18 +646,34 @@ class Responses:
             response_id: The ID of the response to retrieve.
 
         Returns:
-            The Response object.
+            The Response object. With caching on, every call gets its own copy, so
+            changing it does not affect the cached response.
 
         Raises:
             CloudglueError: If there is an error retrieving the response.
         """
-        try:
-            return self.api.get_response(id=response_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
-
+        if self._cache is not None:
+            cached = self._cache.get(response_id)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        response = self.api.get_response(id=response_id)
+
+        if self._cache is not None:
+            ttl = None
+            if response.status in _FINISHED_RESPONSE_STATES:
+                ttl = min(_FINISHED_RESPONSE_TTL, self._cache.ttl)
+            self._cache.set(response_id, response.model_copy(deep=True), ttl=ttl)
+        return response
+
+    def clear_cache(self):
+        """Drop all responses cached by get() and create()."""
+        if self._cache is not None:
+            self._cache.clear()
+        if self._create_cache is not None:
+            self._create_cache.clear()
+
+    @_wrap_api_errors
     def list(
         self,
         limit: Optional[int] = None,
@@ -235,19 +697,47 @@ class Responses:
         Raises:
             CloudglueError: If there is an error listing responses.
         """
-        try:
-            return self.api.list_responses(
-                limit=limit,
-                offset=offset,
-                status=status,
-                created_before=created_before,
-                created_after=created_after,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.list_responses(
+            limit=limit,
+            offset=offset,
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+        )
 
+    def iter_all(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        status: Optional[str] = None,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+    ):
+        """Iterate over all responses, fetching pages as needed.
+
+        The API pages by offset, so responses created while iterating can shift
+        later pages and be skipped or returned twice.
+
+        Args:
+            page_size: Number of responses requested per page (max 100).
+            status: Filter by status.
+            created_before: Filter by creation date (YYYY-MM-DD format, UTC).
+            created_after: Filter by creation date (YYYY-MM-DD format, UTC).
+
+        Yields:
+            Response objects.
+
+        Raises:
+            CloudglueError: If there is an error listing responses.
+        """
+        yield from _paginate(
+            self.list,
+            page_size,
+            status=status,
+            created_before=created_before,
+            created_after=created_after,
+        )
+
+    @_wrap_api_errors
     def delete(self, response_id: str):
         """Delete a response.
 
@@ -260,13 +750,35 @@ class Responses:
         Raises:
             CloudglueError: If there is an error deleting the response.
         """
-        try:
-            return self.api.delete_response(id=response_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        if self._cache is not None:
+            self._cache.pop(response_id)
+        return self.api.delete_response(id=response_id)
+
+    def delete_many(self, response_ids: List[str], max_concurrency: int = 10):
+        """Delete several responses concurrently.
 
+        Every deletion is attempted even if some of them fail.
+
+        Args:
+            response_ids: The IDs of the responses to delete.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The deletion confirmations, in the order of response_ids.
+
+        Raises:
+            CloudglueError: If any deletion failed. Its data lists, in the order of
+                response_ids, the confirmation or the CloudglueError for each response.
+        """
+        return _map_concurrently_settled(
+            self.delete,
+            response_ids,
+            max_concurrency,
+            description="deletions",
+            executor=self._executor,
+        )
+
+    @_wrap_api_errors
     def cancel(self, response_id: str):
         """Cancel a background response that is in progress.
 
@@ -279,12 +791,9 @@ class Responses:
         Raises:
             CloudglueError: If there is an error cancelling the response.
         """
-        try:
-            return self.api.cancel_response(id=response_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        if self._cache is not None:
+            self._cache.pop(response_id)
+        return self.api.cancel_response(id=response_id)
 
     @staticmethod
     def create_entity_collection_config(
@@ -361,13 +870,14 @@ class Responses:
 
     @staticmethod
     def create_filter(
-        metadata: Optional[List[Dict[str, Any]]] = None,
-        video_info: Optional[List[Dict[str, Any]]] = None,
-        file: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        video_info: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+        file: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
     ) -> SearchFilter:
         """Create a search filter to narrow down results within collections.
 
         Each filter criterion is a dict with 'path', 'operator', and 'valueText' or 'valueTextArray'.
+        A single criterion may be passed as a dict instead of a one-element list.
 
         Supported operators: Equal, NotEqual, LessThan, GreaterThan, In, ContainsAny, ContainsAll, Like.
 
@@ -399,8 +909,8 @@ class Responses:
                 video_info=[{"path": "duration_seconds", "operator": "GreaterThan", "valueText": "60"}]
             )
         """
-        return SearchFilter(
-            metadata=[SearchFilterMetadataInner.from_dict(m) for m in metadata] if metadata else None,
-            video_info=[SearchFilterVideoInfoInner.from_dict(v) for v in video_info] if video_info else None,
-            file=[SearchFilterFileInner.from_dict(f) for f in file] if file else None,
-        )
+        return SearchFilter.from_dict({
+            "metadata": _criteria_list(metadata) if metadata else None,
+            "video_info": _criteria_list(video_info) if video_info else None,
+            "file": _criteria_list(file) if file else None,
+        })
@@ -1,6 +1,6 @@
 # cloudglue/client/resources/segments.py
 """Segments resource for Cloudglue API."""
-import time
+import threading
 from typing import Dict, Any, Optional, Union
 
 from cloudglue.sdk.models.new_segments import NewSegments
@@ -11,6 +11,12 @@ from cloudglue.sdk.models.segments_list import SegmentsList
 from cloudglue.sdk.rest import ApiException
 
 from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _JOB_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class Segments:
@@ -225,6 +231,8 @@ class Segments:
         narrative_config: Optional[Union[NarrativeConfig, Dict[str, Any]]] = None,
         poll_interval: int = 5,
         timeout: int = 600,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> SegmentsModel:
         """Create a segmentation job and wait for it to complete.
 
@@ -236,8 +244,10 @@ class Segments:
             criteria: Segmentation criteria ('shot' or 'narrative')
             shot_config: Configuration for shot-based segmentation (only when criteria is 'shot')
             narrative_config: Configuration for narrative-based segmentation (only when criteria is 'narrative')
-            poll_interval: How often to check the job status (in seconds).
+            poll_interval: Maximum interval between job status checks (in seconds).
             timeout: Maximum time to wait for the job to complete (in seconds).
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
 
         Returns:
             Segments: The completed Segments object with status and segments data.
@@ -257,19 +267,15 @@ class Segments:
             job_id = job.job_id
 
             # Poll for completion
-            elapsed = 0
-            while elapsed < timeout:
-                status = self.get(job_id=job_id)
-
-                if status.status in ["completed", "failed"]:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            raise TimeoutError(
-                f"Segmentation job did not complete within {timeout} seconds"
+            return _poll(
+                lambda: self.get(job_id=job_id),
+                lambda status: status.status in _JOB_TERMINAL_STATES,
+                _resolve_poll_settings(poll_settings, poll_interval, timeout),
+                description="Segmentation job",
+                cancel_event=cancel_event,
             )
+        except TimeoutError:
+            raise
         except ApiException as e:
             raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
         except Exception as e:
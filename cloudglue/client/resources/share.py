@@ -1,21 +1,37 @@
 # cloudglue/client/resources/share.py
 """Share resource for Cloudglue API."""
-from typing import Dict, Any, Optional
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional
 
 from cloudglue.sdk.models.create_shareable_asset_request import CreateShareableAssetRequest
 from cloudglue.sdk.models.update_shareable_asset_request import UpdateShareableAssetRequest
-from cloudglue.sdk.rest import ApiException
 
-from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.base import _map_concurrently_settled, _wrap_api_errors
+from cloudglue.client.resources.cache import TTLCache
+from cloudglue.client.resources.pagination import MAX_PAGE_SIZE, _paginate
 
 
 class Share:
     """Handles shareable asset operations for the Cloudglue API."""
 
-    def __init__(self, api):
-        """Initialize with the API client."""
+    def __init__(
+        self,
+        api,
+        cache: Optional[TTLCache] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize with the API client.
+
+        Args:
+            api: The generated Share API client.
+            cache: Optional cache for get() results, keyed by shareable asset ID.
+            executor: Optional thread pool shared by concurrent helpers such as delete_many().
+        """
         self.api = api
+        self._cache = cache
+        self._executor = executor
 
+    @_wrap_api_errors
     def create(
         self,
         file_id: str,
@@ -39,20 +55,40 @@ class Share:
         Raises:
             CloudglueError: If there is an error creating the shareable asset.
         """
-        try:
-            request = CreateShareableAssetRequest(
-                file_id=file_id,
-                file_segment_id=file_segment_id,
-                title=title,
-                description=description,
-                metadata=metadata,
-            )
-            return self.api.create_shareable_asset(create_shareable_asset_request=request)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        request = CreateShareableAssetRequest(
+            file_id=file_id,
+            file_segment_id=file_segment_id,
+            title=title,
+            description=description,
+            metadata=metadata,
+        )
+        return self.api.create_shareable_asset(create_shareable_asset_request=request)
+
+    def create_many(self, assets: List[Dict[str, Any]], max_concurrency: int = 10):
+        """Create several shareable assets concurrently.
 
+        Every asset is attempted even if some of them fail.
+
+        Args:
+            assets: Keyword arguments for create(), one dict per asset.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            ShareableAsset objects, in the order of assets.
+
+        Raises:
+            CloudglueError: If any asset could not be created. Its data lists, in the
+                order of assets, the ShareableAsset or the CloudglueError for each one.
+        """
+        return _map_concurrently_settled(
+            lambda kwargs: self.create(**kwargs),
+            assets,
+            max_concurrency,
+            description="shares",
+            executor=self._executor,
+        )
+
+    @_wrap_api_errors
     def get(self, shareable_asset_id: str):
         """Get a specific shareable asset by ID.
 
@@ -60,18 +96,29 @@ class Share:
             shareable_asset_id: The ID of the shareable asset to retrieve.
 
         Returns:
-            ShareableAsset object.
+            ShareableAsset object. With caching on, every call gets its own copy, so
+            changing it does not affect the cached asset.
 
         Raises:
             CloudglueError: If there is an error retrieving the shareable asset.
         """
-        try:
-            return self.api.get_shareable_asset(id=shareable_asset_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        if self._cache is not None:
+            cached = self._cache.get(shareable_asset_id)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        asset = self.api.get_shareable_asset(id=shareable_asset_id)
 
+        if self._cache is not None:
+            self._cache.set(shareable_asset_id, asset.model_copy(deep=True))
+        return asset
+
+    def clear_cache(self):
+        """Drop all shareable assets cached by get()."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @_wrap_api_errors
     def list(
         self,
         file_id: Optional[str] = None,
@@ -97,20 +144,51 @@ class Share:
         Raises:
             CloudglueError: If there is an error listing shareable assets.
         """
-        try:
-            return self.api.list_shareable_assets(
-                file_id=file_id,
-                file_segment_id=file_segment_id,
-                limit=limit,
-                offset=offset,
-                created_before=created_before,
-                created_after=created_after,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        return self.api.list_shareable_assets(
+            file_id=file_id,
+            file_segment_id=file_segment_id,
+            limit=limit,
+            offset=offset,
+            created_before=created_before,
+            created_after=created_after,
+        )
 
+    def iter_all(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        file_id: Optional[str] = None,
+        file_segment_id: Optional[str] = None,
+        created_before: Optional[str] = None,
+        created_after: Optional[str] = None,
+    ):
+        """Iterate over all shareable assets, fetching pages as needed.
+
+        The API pages by offset, so assets created while iterating can shift later
+        pages and be skipped or returned twice.
+
+        Args:
+            page_size: Number of assets requested per page (max 100).
+            file_id: Filter by file ID.
+            file_segment_id: Filter by file segment ID.
+            created_before: Filter by creation date (YYYY-MM-DD format, UTC).
+            created_after: Filter by creation date (YYYY-MM-DD format, UTC).
+
+        Yields:
+            ShareableAsset objects.
+
+        Raises:
+            CloudglueError: If there is an error listing shareable assets.
+        """
+        yield from _paginate(
+            self.list,
+            page_size,
+            file_id=file_id,
+            file_segment_id=file_segment_id,
+            created_before=created_before,
+            created_after=created_after,
+        )
+
+    @_wrap_api_errors
     def update(
         self,
         shareable_asset_id: str,
@@ -132,21 +210,19 @@ class Share:
         Raises:
             CloudglueError: If there is an error updating the shareable asset.
         """
-        try:
-            request = UpdateShareableAssetRequest(
-                title=title,
-                description=description,
-                metadata=metadata,
-            )
-            return self.api.update_shareable_asset(
-                id=shareable_asset_id,
-                update_shareable_asset_request=request,
-            )
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        if self._cache is not None:
+            self._cache.pop(shareable_asset_id)
+        request = UpdateShareableAssetRequest(
+            title=title,
+            description=description,
+            metadata=metadata,
+        )
+        return self.api.update_shareable_asset(
+            id=shareable_asset_id,
+            update_shareable_asset_request=request,
+        )
 
+    @_wrap_api_errors
     def delete(self, shareable_asset_id: str):
         """Delete a shareable asset.
 
@@ -159,9 +235,30 @@ class Share:
         Raises:
             CloudglueError: If there is an error deleting the shareable asset.
         """
-        try:
-            return self.api.delete_shareable_asset(id=shareable_asset_id)
-        except ApiException as e:
-            raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
-        except Exception as e:
-            raise CloudglueError(str(e))
+        if self._cache is not None:
+            self._cache.pop(shareable_asset_id)
+        return self.api.delete_shareable_asset(id=shareable_asset_id)
+
+    def delete_many(self, shareable_asset_ids: List[str], max_concurrency: int = 10):
+        """Delete several shareable assets concurrently.
+
+        Every deletion is attempted even if some of them fail.
+
+        Args:
+            shareable_asset_ids: The IDs of the shareable assets to delete.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The deletion confirmations, in the order of shareable_asset_ids.
+
+        Raises:
+            CloudglueError: If any deletion failed. Its data lists, in the order of
+                shareable_asset_ids, the confirmation or the CloudglueError for each asset.
+        """
+        return _map_concurrently_settled(
+            self.delete,
+            shareable_asset_ids,
+            max_concurrency,
+            description="deletions",
+            executor=self._executor,
+        )
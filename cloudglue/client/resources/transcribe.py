@@ -1,6 +1,6 @@
 # cloudglue/client/resources/transcribe.py
 """Transcribe resource for Cloudglue API."""
-import time
+import threading
 from typing import Dict, Any, Optional, Union
 
 from cloudglue.sdk.models.new_transcribe import NewTranscribe
@@ -9,6 +9,13 @@ from cloudglue.sdk.models.thumbnails_config import ThumbnailsConfig
 from cloudglue.sdk.rest import ApiException
 
 from cloudglue.client.resources.base import CloudglueError
+from cloudglue.client.resources.polling import (
+    PollSettings,
+    _ConditionalGet,
+    _JOB_TERMINAL_STATES,
+    _poll,
+    _resolve_poll_settings,
+)
 
 
 class Transcribe:
@@ -164,13 +171,17 @@ class Transcribe:
         segmentation_config: Optional[Union[SegmentationConfig, Dict[str, Any]]] = None,
         thumbnails_config: Optional[Union[Dict[str, Any], Any]] = None,
         response_format: Optional[str] = None,
+        poll_settings: Optional[PollSettings] = None,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Create a transcribe job and wait for it to complete.
 
         Args:
             url: Input video URL. Can be YouTube URLs or URIs of uploaded files.
-            poll_interval: Seconds between status checks.
+            poll_interval: Maximum seconds between status checks.
             timeout: Total seconds to wait before giving up.
+            poll_settings: Backoff strategy for status checks. Overrides poll_interval and timeout.
+            cancel_event: Event that stops waiting as soon as it is set, e.g. from another thread.
             enable_summary: Whether to generate a summary of the video.
             enable_speech: Whether to generate speech transcript.
             enable_scene_text: Whether to generate scene text.
@@ -185,6 +196,7 @@ class Transcribe:
 
         Raises:
             CloudglueError: If there is an error creating or processing the transcribe job.
+            TimeoutError: If the job does not complete within the specified timeout.
         """
         try:
             # Create the job
@@ -203,20 +215,22 @@ class Transcribe:
             job_id = job.job_id
 
             # Poll for completion
-            elapsed = 0
-            while elapsed < timeout:
-                status = self.get(job_id=job_id, response_format=response_format)
-
-                if status.status in ["completed", "failed"]:
-                    return status
-
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-
-            raise TimeoutError(
-                f"Transcribe job did not complete within {timeout} seconds"
+            get_transcribe = _ConditionalGet(
+                self.api.api_client,
+                self.api.get_transcribe_without_preload_content,
+                "Transcribe",
+                _JOB_TERMINAL_STATES,
+            )
+            return _poll(
+                lambda: get_transcribe(job_id=job_id, response_format=response_format),
+                lambda status: status.status in _JOB_TERMINAL_STATES,
+                _resolve_poll_settings(poll_settings, poll_interval, timeout),
+                description="Transcribe job",
+                cancel_event=cancel_event,
             )
 
+        except TimeoutError:
+            raise
         except ApiException as e:
             raise CloudglueError(str(e), e.status, e.data, e.headers, e.reason)
         except Exception as e:
@@ -14,15 +14,13 @@
 
 from __future__ import annotations
 import pprint
-import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
-from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, TypeAdapter
+from typing import Any, Dict, List, Optional
 from cloudglue.sdk.models.describe_data_all_of_segment_summary_inner import DescribeDataAllOfSegmentSummaryInner
 from cloudglue.sdk.models.describe_output_part import DescribeOutputPart
 from cloudglue.sdk.models.speech_output_part import SpeechOutputPart
-from typing import Optional, Set
 from typing_extensions import Self
 
 class DescribeData(BaseModel):
@@ -37,7 +35,6 @@ class DescribeData(BaseModel):
     title: Optional[StrictStr] = Field(default=None, description="Generated title of the video; for YouTube videos, this is the title of the video as it appears on YouTube")
     summary: Optional[StrictStr] = Field(default=None, description="Generated video level summary; for YouTube videos, this is the summary of the video as it appears on YouTube")
     segment_summary: Optional[List[DescribeDataAllOfSegmentSummaryInner]] = Field(default=None, description="Array of summary information for each segment of the video. Only available when enable_summary is set to true in the describe configuration.")
-    __properties: ClassVar[List[str]] = ["visual_scene_description", "scene_text", "speech", "audio_description", "content", "title", "summary", "segment_summary"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -46,14 +43,24 @@ class DescribeData(BaseModel):
     )
 
 
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
+    def to_str(self, pretty: bool = False) -> str:
+        """Returns the string representation of the model.
+
+        This is the model's repr unless ``pretty`` is set, in which case the
+        dictionary representation using alias is pretty-printed.
+        """
+        if pretty:
+            return pprint.pformat(self.model_dump(by_alias=True))
+        return repr(self)
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Returns the UTF-8 encoded JSON representation of the model using alias"""
+        # None of the nested models keep explicit nulls, so this matches to_dict()
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
@@ -63,57 +70,10 @@ class DescribeData(BaseModel):
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
 
-        This has the following differences from calling pydantic's
-        `self.model_dump(by_alias=True)`:
-
-        * `None` is only added to the output dict for nullable fields that
-          were set at model initialization. Other fields with value `None`
-          are ignored.
+        Nested models are dumped by pydantic too, since none of them keep explicit
+        nulls; `None` values are left out at every level.
         """
-        excluded_fields: Set[str] = set([
-        ])
-
-        _dict = self.model_dump(
-            by_alias=True,
-            exclude=excluded_fields,
-            exclude_none=True,
-        )
-        # override the default output from pydantic by calling `to_dict()` of each item in visual_scene_description (list)
-        _items = []
-        if self.visual_scene_description:
-            for _item_visual_scene_description in self.visual_scene_description:
-                if _item_visual_scene_description:
-                    _items.append(_item_visual_scene_description.to_dict())
-            _dict['visual_scene_description'] = _items
-        # override the default output from pydantic by calling `to_dict()` of each item in scene_text (list)
-        _items = []
-        if self.scene_text:
-            for _item_scene_text in self.scene_text:
-                if _item_scene_text:
-                    _items.append(_item_scene_text.to_dict())
-            _dict['scene_text'] = _items
-        # override the default output from pydantic by calling `to_dict()` of each item in speech (list)
-        _items = []
-        if self.speech:
-            for _item_speech in self.speech:
-                if _item_speech:
-                    _items.append(_item_speech.to_dict())
-            _dict['speech'] = _items
-        # override the default output from pydantic by calling `to_dict()` of each item in audio_description (list)
-        _items = []
-        if self.audio_description:
-            for _item_audio_description in self.audio_description:
-                if _item_audio_description:
-                    _items.append(_item_audio_description.to_dict())
-            _dict['audio_description'] = _items
-        # override the default output from pydantic by calling `to_dict()` of each item in segment_summary (list)
-        _items = []
-        if self.segment_summary:
-            for _item_segment_summary in self.segment_summary:
-                if _item_segment_summary:
-                    _items.append(_item_segment_summary.to_dict())
-            _dict['segment_summary'] = _items
-        return _dict
+        return self.model_dump(by_alias=True, exclude_none=True)
 
     @classmethod
     def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
@@ -124,16 +84,16 @@ class DescribeData(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
-            "visual_scene_description": [DescribeOutputPart.from_dict(_item) for _item in obj["visual_scene_description"]] if obj.get("visual_scene_description") is not None else None,
-            "scene_text": [DescribeOutputPart.from_dict(_item) for _item in obj["scene_text"]] if obj.get("scene_text") is not None else None,
-            "speech": [SpeechOutputPart.from_dict(_item) for _item in obj["speech"]] if obj.get("speech") is not None else None,
-            "audio_description": [DescribeOutputPart.from_dict(_item) for _item in obj["audio_description"]] if obj.get("audio_description") is not None else None,
-            "content": obj.get("content"),
-            "title": obj.get("title"),
-            "summary": obj.get("summary"),
-            "segment_summary": [DescribeDataAllOfSegmentSummaryInner.from_dict(_item) for _item in obj["segment_summary"]] if obj.get("segment_summary") is not None else None
-        })
+        # The nested models have no custom from_dict() logic, so pydantic-core
+        # validates the nested lists straight from the raw dicts
+        _obj = cls.model_validate(obj)
         return _obj
 
+    @classmethod
+    def dump_many_json(cls, items: List[Self]) -> bytes:
+        """Returns the UTF-8 encoded JSON array of several DescribeData instances using alias"""
+        return _LIST_ADAPTER.dump_json(items, by_alias=True, exclude_none=True)
+
 
+# Serializes a whole list of DescribeData in pydantic-core, used by dump_many_json()
+_LIST_ADAPTER = TypeAdapter(List[DescribeData])
@@ -14,12 +14,10 @@
 
 from __future__ import annotations
 import pprint
-import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr
-from typing import Any, ClassVar, Dict, List, Optional, Union
-from typing import Optional, Set
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr, TypeAdapter
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 from typing_extensions import Self
 
 class FileVideoInfo(BaseModel):
@@ -31,7 +29,7 @@ class FileVideoInfo(BaseModel):
     width: Optional[StrictInt] = Field(default=None, description="Width of the video in pixels, null if not available")
     format: Optional[StrictStr] = Field(default=None, description="Format of the video file, null if not available")
     has_audio: Optional[StrictBool] = Field(default=None, description="Whether the video has audio, null if not available")
-    __properties: ClassVar[List[str]] = ["duration_seconds", "height", "width", "format", "has_audio"]
+    _NULLABLE_FIELDS: ClassVar[Tuple[str, ...]] = ("duration_seconds", "height", "width", "format", "has_audio")
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -40,14 +38,25 @@ class FileVideoInfo(BaseModel):
     )
 
 
-    def to_str(self) -> str:
-        """Returns the string representation of the model using alias"""
-        return pprint.pformat(self.model_dump(by_alias=True))
+    def to_str(self, pretty: bool = False) -> str:
+        """Returns the string representation of the model.
+
+        This is the model's repr unless ``pretty`` is set, in which case the
+        dictionary representation using alias is pretty-printed.
+        """
+        if pretty:
+            return pprint.pformat(self.model_dump(by_alias=True))
+        return repr(self)
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        """Returns the UTF-8 encoded JSON representation of the model using alias"""
+        # Every field is nullable and defaults to None, so the fields that were set
+        # are exactly the ones to_dict() keeps
+        return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_unset=True)
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
@@ -64,38 +73,16 @@ class FileVideoInfo(BaseModel):
           were set at model initialization. Other fields with value `None`
           are ignored.
         """
-        excluded_fields: Set[str] = set([
-        ])
-
         _dict = self.model_dump(
             by_alias=True,
-            exclude=excluded_fields,
             exclude_none=True,
         )
-        # set to None if duration_seconds (nullable) is None
-        # and model_fields_set contains the field
-        if self.duration_seconds is None and "duration_seconds" in self.model_fields_set:
-            _dict['duration_seconds'] = None
-
-        # set to None if height (nullable) is None
-        # and model_fields_set contains the field
-        if self.height is None and "height" in self.model_fields_set:
-            _dict['height'] = None
-
-        # set to None if width (nullable) is None
-        # and model_fields_set contains the field
-        if self.width is None and "width" in self.model_fields_set:
-            _dict['width'] = None
-
-        # set to None if format (nullable) is None
+        # set to None if a nullable field is None
         # and model_fields_set contains the field
-        if self.format is None and "format" in self.model_fields_set:
-            _dict['format'] = None
-
-        # set to None if has_audio (nullable) is None
-        # and model_fields_set contains the field
-        if self.has_audio is None and "has_audio" in self.model_fields_set:
-            _dict['has_audio'] = None
+        _fields_set = self.model_fields_set
+        for _field in self._NULLABLE_FIELDS:
+            if _field not in _dict and _field in _fields_set:
+                _dict[_field] = None
 
         return _dict
 
@@ -117,4 +104,11 @@ class FileVideoInfo(BaseModel):
         })
         return _obj
 
+    @classmethod
+    def dump_many_json(cls, items: List[Self]) -> bytes:
+        """Returns the UTF-8 encoded JSON array of several FileVideoInfo instances using alias"""
+        return _LIST_ADAPTER.dump_json(items, by_alias=True, exclude_unset=True)
+
 
+# Serializes a whole list of FileVideoInfo in pydantic-core, used by dump_many_json()
+_LIST_ADAPTER = TypeAdapter(List[FileVideoInfo])